@@ -1,6 +1,26 @@
-"""Entry point for python -m granola_sync."""
+"""Entry point for python -m granola_sync and the granola-sync script."""
 
-from granola_sync.cli import app
+import sys
+
+_VERSION_FLAGS = ("--version", "-V")
+
+
+def main() -> None:
+    """Run the CLI.
+
+    A bare version query is answered directly, without importing Typer or
+    registering any of the commands in granola_sync.cli.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in _VERSION_FLAGS:
+        from granola_sync import __version__
+
+        print(f"granola-sync {__version__}")
+        return
+
+    from granola_sync.cli import app
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,58 @@
 """CLI commands for granola-sync."""
 
-import asyncio
-import os
-import platform
-import secrets
-import shutil
-import subprocess
+import functools
 import sys
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, NoReturn, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .config import (
-    Config,
-    GranolaConfig,
-    LoggingConfig,
-    StateConfig,
-    SyncConfig,
-    WebhookConfig,
-    get_default_config_path,
-    load_config,
-    save_config,
-)
-from .logging import setup_logging
-from .sync import SyncService
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .config import Config
+
+# Heavy modules (rich, pydantic/yaml via .config, httpx/structlog via .sync,
+# asyncio, subprocess) are imported inside the commands that need them so that
+# --help, --version and shell completion stay fast.
 
 app = typer.Typer(
     name="granola-sync",
     help="Sync Granola meeting notes to a webhook endpoint.",
     no_args_is_help=True,
 )
-console = Console()
+
+
+NO_CONFIG_MESSAGE = "No configuration found. Run 'granola-sync config' to set up."
+
+
+@functools.cache
+def _console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _fail(message: str, *details: str) -> NoReturn:
+    """Print an error to stderr and exit with status 1.
+
+    Uses plain print so that error exits don't pay for importing Rich.
+
+    Args:
+        message: The error message
+        details: Extra lines printed after the message
+    """
+    print(f"Error: {message}", *details, sep="\n", file=sys.stderr)
+    raise typer.Exit(1)
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"granola-sync {__version__}")
+        print(f"granola-sync {__version__}")
         raise typer.Exit()
 
 
@@ -119,6 +131,12 @@ def run(
     ] = False,
 ) -> None:
     """Run the sync service in foreground mode."""
+    import asyncio
+
+    from .granola_api import close_shared_client
+    from .logging import setup_logging
+    from .sync import SyncService
+
     try:
         config = _load_or_create_config(
             config_path=config_path,
@@ -129,11 +147,9 @@ def run(
             include_transcript=include_transcript,
         )
     except FileNotFoundError:
-        console.print(
-            "[red]Error:[/red] No configuration found. Run 'granola-sync config' to set up.",
-            style="bold",
-        )
-        raise typer.Exit(1)
+        _fail(NO_CONFIG_MESSAGE)
+
+    console = _console()
 
     setup_logging(
         level="DEBUG" if verbose else config.logging.level,
@@ -148,8 +164,14 @@ def run(
 
     service = SyncService(config)
 
+    async def run_service():
+        try:
+            await service.run()
+        finally:
+            await close_shared_client()
+
     try:
-        asyncio.run(service.run())
+        asyncio.run(run_service())
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopping sync service...[/yellow]")
         service.stop()
@@ -190,14 +212,18 @@ def sync_once(
     ] = False,
 ) -> None:
     """Perform a single sync cycle and exit."""
+    import asyncio
+
+    from .granola_api import close_shared_client
+    from .logging import setup_logging
+    from .sync import SyncService
+
     try:
         config = _load_or_create_config(config_path=config_path, folders=folder)
     except FileNotFoundError:
-        console.print(
-            "[red]Error:[/red] No configuration found. Run 'granola-sync config' to set up.",
-            style="bold",
-        )
-        raise typer.Exit(1)
+        _fail(NO_CONFIG_MESSAGE)
+
+    console = _console()
 
     setup_logging(level="DEBUG" if verbose else config.logging.level)
 
@@ -213,6 +239,7 @@ def sync_once(
             return summary
         finally:
             await service.close()
+            await close_shared_client()
 
     summary = asyncio.run(run_sync())
 
@@ -231,6 +258,21 @@ def config(
     ] = False,
 ) -> None:
     """Configure the sync service interactively."""
+    import secrets
+
+    from .config import (
+        Config,
+        GranolaConfig,
+        LoggingConfig,
+        StateConfig,
+        SyncConfig,
+        WebhookConfig,
+        get_default_config_path,
+        load_config,
+        save_config,
+    )
+
+    console = _console()
     console.print("[bold]Granola Sync Configuration[/bold]")
     console.print()
 
@@ -322,41 +364,50 @@ def status(
     ] = None,
 ) -> None:
     """Show sync status and statistics."""
+    from .config import load_config
+
     try:
         config = load_config(config_path)
     except FileNotFoundError:
-        console.print(
-            "[red]Error:[/red] No configuration found. Run 'granola-sync config' to set up.",
-            style="bold",
-        )
-        raise typer.Exit(1)
+        _fail(NO_CONFIG_MESSAGE)
+
+    console = _console()
+
+    from rich.console import Group, RenderableType
 
     from .state import StateManager
 
     state = StateManager(config.state.file)
     stats = state.get_stats()
 
-    console.print("[bold]Granola Sync Status[/bold]")
-    console.print()
-
-    # Config summary
-    console.print("[bold]Configuration:[/bold]")
-    console.print(f"  Folders: {', '.join(config.granola.folders)}")
-    console.print(f"  Webhook: {config.webhook.url}")
-    console.print(f"  Interval: {config.sync.interval}s")
-    console.print()
-
-    # Stats
-    console.print("[bold]Statistics:[/bold]")
-    console.print(f"  Total synced: {stats['total_synced']}")
-    console.print(f"  Total errors: {stats['total_errors']}")
+    # Collect everything and render it with a single print
+    renderables: list[RenderableType] = []
+    lines = [
+        "[bold]Granola Sync Status[/bold]",
+        "",
+        # Config summary
+        "[bold]Configuration:[/bold]",
+        f"  Folders: {', '.join(config.granola.folders)}",
+        f"  Webhook: {config.webhook.url}",
+        f"  Interval: {config.sync.interval}s",
+        "",
+        # Stats
+        "[bold]Statistics:[/bold]",
+        f"  Total synced: {stats['total_synced']}",
+        f"  Total errors: {stats['total_errors']}",
+    ]
     if stats.get("last_error"):
-        console.print(f"  Last error: {stats['last_error']}")
-    console.print()
+        lines.append(f"  Last error: {stats['last_error']}")
+    lines.append("")
 
     # Per-folder stats
     if stats.get("by_folder"):
-        console.print("[bold]By Folder:[/bold]")
+        from rich.table import Table
+
+        lines.append("[bold]By Folder:[/bold]")
+        renderables.append("\n".join(lines))
+        lines = []
+
         table = Table(show_header=True)
         table.add_column("Folder")
         table.add_column("Synced", justify="right")
@@ -369,17 +420,22 @@ def status(
                 str(folder_stats.get("errors", 0)),
             )
 
-        console.print(table)
+        renderables.append(table)
 
     # Failed documents
     failed = state.get_failed_documents()
     if failed:
-        console.print()
-        console.print(f"[yellow]Failed documents ({len(failed)}):[/yellow]")
+        lines.append("")
+        lines.append(f"[yellow]Failed documents ({len(failed)}):[/yellow]")
         for doc_id, info in list(failed.items())[:5]:
-            console.print(f"  - {info.get('title', doc_id)}: {info.get('last_error')}")
+            lines.append(f"  - {info.get('title', doc_id)}: {info.get('last_error')}")
         if len(failed) > 5:
-            console.print(f"  ... and {len(failed) - 5} more")
+            lines.append(f"  ... and {len(failed) - 5} more")
+
+    if lines:
+        renderables.append("\n".join(lines))
+
+    console.print(Group(*renderables))
 
 
 def _load_or_create_config(
@@ -389,8 +445,10 @@ def _load_or_create_config(
     webhook_secret: Optional[str] = None,
     interval: Optional[int] = None,
     include_transcript: Optional[bool] = None,
-) -> Config:
+) -> "Config":
     """Load config and apply CLI overrides."""
+    from .config import load_config
+
     config = load_config(config_path)
 
     # Apply overrides
@@ -410,46 +468,54 @@ def _load_or_create_config(
 
 def _display_sync_summary(summary: dict, dry_run: bool) -> None:
     """Display sync summary in a nice format."""
-    console.print("[bold]Sync Summary[/bold]")
-    console.print()
-
-    console.print(f"  Folders checked: {summary['folders_checked']}")
-    console.print(f"  Documents found: {summary['documents_found']}")
-    console.print(f"  New/updated: {summary['documents_new']}")
+    # Build the whole summary first and render it with a single print
+    lines = [
+        "[bold]Sync Summary[/bold]",
+        "",
+        f"  Folders checked: {summary['folders_checked']}",
+        f"  Documents found: {summary['documents_found']}",
+        f"  New/updated: {summary['documents_new']}",
+    ]
 
     if dry_run:
-        console.print(f"  Would sync: {summary['documents_synced']}")
+        lines.append(f"  Would sync: {summary['documents_synced']}")
     else:
-        console.print(f"  Synced: {summary['documents_synced']}")
+        lines.append(f"  Synced: {summary['documents_synced']}")
         if summary['documents_failed'] > 0:
-            console.print(f"  [red]Failed: {summary['documents_failed']}[/red]")
+            lines.append(f"  [red]Failed: {summary['documents_failed']}[/red]")
 
-    console.print()
+    lines.append("")
 
     # Show documents per folder
     for folder_name, folder_summary in summary.get("by_folder", {}).items():
         if folder_summary.get("documents"):
-            console.print(f"[bold]{folder_name}:[/bold]")
+            lines.append(f"[bold]{folder_name}:[/bold]")
             for doc in folder_summary["documents"]:
                 action = doc["action"]
                 if action == "would_sync":
-                    console.print(f"  [yellow]○[/yellow] {doc['title']}")
+                    lines.append(f"  [yellow]○[/yellow] {doc['title']}")
                 elif action == "synced":
-                    console.print(f"  [green]✓[/green] {doc['title']}")
+                    lines.append(f"  [green]✓[/green] {doc['title']}")
                 else:
-                    console.print(f"  [red]✗[/red] {doc['title']}")
-            console.print()
+                    lines.append(f"  [red]✗[/red] {doc['title']}")
+            lines.append("")
+
+    _console().print("\n".join(lines))
 
 
 # Service management constants
 LAUNCHD_LABEL = "com.turbo.granola-sync"
-LAUNCHD_PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / f"{LAUNCHD_LABEL}.plist"
+_HOME = Path.home()
+LAUNCHD_PLIST_PATH = _HOME / "Library" / "LaunchAgents" / f"{LAUNCHD_LABEL}.plist"
 SYSTEMD_SERVICE_NAME = "granola-sync"
-SYSTEMD_SERVICE_PATH = Path.home() / ".config" / "systemd" / "user" / f"{SYSTEMD_SERVICE_NAME}.service"
+SYSTEMD_SERVICE_PATH = _HOME / ".config" / "systemd" / "user" / f"{SYSTEMD_SERVICE_NAME}.service"
 
 
+@functools.cache
 def _get_executable_path() -> str:
     """Get the path to the granola-sync executable."""
+    import shutil
+
     # Try to find it in PATH first
     which_result = shutil.which("granola-sync")
     if which_result:
@@ -459,6 +525,14 @@ def _get_executable_path() -> str:
     return f"{sys.executable} -m granola_sync"
 
 
+@functools.cache
+def _extra_path() -> str:
+    """Get extra PATH entries (for uv, pipx, etc.) to expose to the service."""
+    candidates = [_HOME / ".local" / "bin", _HOME / ".cargo" / "bin"]
+    return ":".join(str(p) for p in candidates if p.exists())
+
+
+@functools.cache
 def _get_templates_dir() -> Path:
     """Get the path to the templates directory."""
     # Use importlib.resources to properly locate package data
@@ -473,89 +547,80 @@ def _get_templates_dir() -> Path:
 @app.command()
 def start() -> None:
     """Install and start the sync service as a background daemon."""
+    from .config import load_config
+
     try:
         load_config()
     except FileNotFoundError:
-        console.print(
-            "[red]Error:[/red] No configuration found. Run 'granola-sync config' to set up.",
-            style="bold",
-        )
-        raise typer.Exit(1)
-
-    system = platform.system()
+        _fail(NO_CONFIG_MESSAGE)
 
-    if system == "Darwin":
+    if sys.platform == "darwin":
         _start_launchd()
-    elif system == "Linux":
+    elif sys.platform == "linux":
         _start_systemd()
     else:
-        console.print(f"[red]Error:[/red] Unsupported platform: {system}")
-        console.print("Use 'granola-sync run' to run in foreground instead.")
-        raise typer.Exit(1)
+        _fail(
+            f"Unsupported platform: {sys.platform}",
+            "Use 'granola-sync run' to run in foreground instead.",
+        )
 
 
 @app.command()
 def stop() -> None:
     """Stop and uninstall the background sync service."""
-    system = platform.system()
-
-    if system == "Darwin":
+    if sys.platform == "darwin":
         _stop_launchd()
-    elif system == "Linux":
+    elif sys.platform == "linux":
         _stop_systemd()
     else:
-        console.print(f"[red]Error:[/red] Unsupported platform: {system}")
-        raise typer.Exit(1)
+        _fail(f"Unsupported platform: {sys.platform}")
 
 
 def _start_launchd() -> None:
     """Install and start the launchd service on macOS."""
-    templates_dir = _get_templates_dir()
-    template_path = templates_dir / "launchd.plist"
+    import subprocess
 
-    if not template_path.exists():
-        console.print(f"[red]Error:[/red] Template not found: {template_path}")
-        raise typer.Exit(1)
+    console = _console()
+    template_path = _get_templates_dir() / "launchd.plist"
 
     # Read template
-    with open(template_path) as f:
-        template = f.read()
+    try:
+        template = template_path.read_text()
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Template not found: {template_path}")
+        raise typer.Exit(1) from None
 
     # Get executable path
     executable = _get_executable_path()
 
-    # Determine extra PATH entries (for uv, pipx, etc.)
-    extra_paths = []
-    home = Path.home()
-    for p in [home / ".local" / "bin", home / ".cargo" / "bin"]:
-        if p.exists():
-            extra_paths.append(str(p))
-    extra_path = ":".join(extra_paths) if extra_paths else ""
-
     # Log directory
-    log_dir = home / ".granola-sync"
+    log_dir = _HOME / ".granola-sync"
     log_dir.mkdir(parents=True, exist_ok=True)
 
     # Fill in template
     plist_content = template.format(
         executable=executable,
         log_dir=str(log_dir),
-        extra_path=extra_path,
-        home=str(home),
+        extra_path=_extra_path(),
+        home=str(_HOME),
     )
 
+    # A previous install may still be loaded; a fresh one can't be
+    previously_installed = LAUNCHD_PLIST_PATH.exists()
+
     # Write plist
     LAUNCHD_PLIST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(LAUNCHD_PLIST_PATH, "w") as f:
-        f.write(plist_content)
+    LAUNCHD_PLIST_PATH.write_text(plist_content)
 
     console.print(f"[green]✓[/green] Created launchd plist at {LAUNCHD_PLIST_PATH}")
 
     # Unload if already loaded (ignore errors)
-    subprocess.run(
-        ["launchctl", "unload", str(LAUNCHD_PLIST_PATH)],
-        capture_output=True,
-    )
+    if previously_installed:
+        subprocess.run(
+            ["launchctl", "unload", str(LAUNCHD_PLIST_PATH)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
     # Load the service
     result = subprocess.run(
@@ -577,6 +642,9 @@ def _start_launchd() -> None:
 
 def _stop_launchd() -> None:
     """Stop and uninstall the launchd service on macOS."""
+    import subprocess
+
+    console = _console()
     if not LAUNCHD_PLIST_PATH.exists():
         console.print("[yellow]Service is not installed[/yellow]")
         return
@@ -600,43 +668,39 @@ def _stop_launchd() -> None:
 
 def _start_systemd() -> None:
     """Install and start the systemd service on Linux."""
-    templates_dir = _get_templates_dir()
-    template_path = templates_dir / "systemd.service"
+    import subprocess
 
-    if not template_path.exists():
-        console.print(f"[red]Error:[/red] Template not found: {template_path}")
-        raise typer.Exit(1)
+    console = _console()
+    template_path = _get_templates_dir() / "systemd.service"
 
     # Read template
-    with open(template_path) as f:
-        template = f.read()
+    try:
+        template = template_path.read_text()
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Template not found: {template_path}")
+        raise typer.Exit(1) from None
 
     # Get executable path
     executable = _get_executable_path()
 
-    # Determine extra PATH entries
-    extra_paths = []
-    home = Path.home()
-    for p in [home / ".local" / "bin", home / ".cargo" / "bin"]:
-        if p.exists():
-            extra_paths.append(str(p))
-    extra_path = ":".join(extra_paths) if extra_paths else ""
-
     # Fill in template
     service_content = template.format(
         executable=executable,
-        extra_path=extra_path,
+        extra_path=_extra_path(),
     )
 
     # Write service file
     SYSTEMD_SERVICE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(SYSTEMD_SERVICE_PATH, "w") as f:
-        f.write(service_content)
+    SYSTEMD_SERVICE_PATH.write_text(service_content)
 
     console.print(f"[green]✓[/green] Created systemd service at {SYSTEMD_SERVICE_PATH}")
 
     # Reload systemd
-    subprocess.run(["systemctl", "--user", "daemon-reload"], capture_output=True)
+    subprocess.run(
+        ["systemctl", "--user", "daemon-reload"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
     # Enable and start
     result = subprocess.run(
@@ -658,10 +722,14 @@ def _start_systemd() -> None:
 
 def _stop_systemd() -> None:
     """Stop and uninstall the systemd service on Linux."""
+    import subprocess
+
+    console = _console()
     # Stop and disable
     subprocess.run(
         ["systemctl", "--user", "disable", "--now", SYSTEMD_SERVICE_NAME],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     # Remove service file
@@ -669,7 +737,11 @@ def _stop_systemd() -> None:
         SYSTEMD_SERVICE_PATH.unlink()
 
     # Reload systemd
-    subprocess.run(["systemctl", "--user", "daemon-reload"], capture_output=True)
+    subprocess.run(
+        ["systemctl", "--user", "daemon-reload"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
     console.print("[green]✓[/green] Service stopped")
     console.print("[green]✓[/green] Removed systemd service")
@@ -1,22 +1,44 @@
 """Configuration loading and validation."""
 
+import functools
 from pathlib import Path
 from typing import Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+# Validators are built on first use rather than at import, so CLI commands that
+# never touch the config don't pay for schema construction. Unknown keys (e.g.
+# from an older config file) are ignored.
+_MODEL_CONFIG = ConfigDict(extra="ignore", defer_build=True)
 
 
 class WebhookConfig(BaseModel):
     """Webhook configuration."""
 
+    model_config = _MODEL_CONFIG
+
     url: str
     secret: str
+    # Send new documents of a folder as {"source": "Granola", "events": [...]}
+    # batches instead of one request per document
+    batch: bool = False
+    batch_size: int = 10
 
 
 class GranolaConfig(BaseModel):
     """Granola API configuration."""
 
+    model_config = _MODEL_CONFIG
+
     folders: list[str] = Field(default_factory=list)
     folder_ids: dict[str, str] = Field(default_factory=dict)
     include_transcript: bool = True
@@ -25,15 +47,30 @@ class GranolaConfig(BaseModel):
 class SyncConfig(BaseModel):
     """Sync settings."""
 
+    model_config = _MODEL_CONFIG
+
     interval: int = 120
     batch_size: int = 10
+    concurrency: int = 5
     retry_attempts: int = 3
-    retry_delay: int = 30
+    retry_delay: float = 30
+    max_retry_delay: float = 300
+
+
+class HttpConfig(BaseModel):
+    """HTTP connection settings shared by the Granola API and webhook clients."""
+
+    model_config = _MODEL_CONFIG
+
+    pool_size: int = 50
+    timeout: float = 30.0
 
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    model_config = _MODEL_CONFIG
+
     level: str = "INFO"
     file: Optional[str] = None
     max_size_mb: int = 10
@@ -43,15 +80,20 @@ class LoggingConfig(BaseModel):
 class StateConfig(BaseModel):
     """State file configuration."""
 
+    model_config = _MODEL_CONFIG
+
     file: str = "~/.granola-sync/state.json"
 
 
 class Config(BaseModel):
     """Main configuration model."""
 
+    model_config = _MODEL_CONFIG
+
     webhook: WebhookConfig
     granola: GranolaConfig = Field(default_factory=GranolaConfig)
     sync: SyncConfig = Field(default_factory=SyncConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     state: StateConfig = Field(default_factory=StateConfig)
 
@@ -79,11 +121,22 @@ def load_config(config_path: Optional[Path] = None) -> Config:
 
     config_path = Path(config_path).expanduser()
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    # Callers apply CLI overrides in place, so never hand out the cached instance
+    return _load_cached(str(config_path), st.st_mtime_ns, st.st_size).model_copy(deep=True)
 
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+
+@functools.lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Config:
+    """Parse and validate a config file.
+
+    Keyed on the file's mtime and size so that edits are picked up on the next load.
+    """
+    data = yaml.load(Path(path).read_text(), Loader=_YamlLoader)
 
     return Config.model_validate(data)
 
@@ -101,9 +154,13 @@ def save_config(config: Config, config_path: Optional[Path] = None) -> None:
     config_path = Path(config_path).expanduser()
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    data = config.model_dump()
-    with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    # JSON mode yields only plain types, which the safe dumper can emit directly
+    data = config.model_dump(mode="json")
+    config_path.write_text(
+        yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+    )
 
     # Set restrictive permissions for security (contains webhook secret)
     config_path.chmod(0o600)
+
+    _load_cached.cache_clear()
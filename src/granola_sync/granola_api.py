@@ -1,12 +1,17 @@
 """Granola API client."""
 
-import json
+import asyncio
+import functools
+import math
 import os
+import ssl
+import sys
 import time
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
+import orjson
 import structlog
 
 logger = structlog.get_logger()
@@ -14,28 +19,57 @@ logger = structlog.get_logger()
 GRANOLA_API_BASE = "https://api.granola.ai"
 TOKEN_REFRESH_BUFFER_SECONDS = 300  # Refresh 5 minutes before expiration
 CACHE_FILENAMES = ["cache-v4.json", "cache-v3.json"]
+DEFAULT_FETCH_CONCURRENCY = 8
+# Longer than the default poll interval so pooled connections survive between cycles
+KEEPALIVE_EXPIRY_SECONDS = 300.0
 
+# The most recently loaded or refreshed workos_tokens, reused until they expire or
+# supabase.json changes (the mtime it had when the tokens were read)
+_cached_workos_tokens: Optional[dict[str, Any]] = None
+_cached_token_file_mtime: Optional[int] = None
 
+# Process-wide HTTP client for the Granola API, see get_shared_client()
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+@functools.cache
 def _get_granola_app_dir() -> Path:
     """Get the platform-specific Granola application data directory."""
-    if os.name == "nt":
+    if sys.platform == "win32":
         app_data = os.environ.get("APPDATA", "")
         return Path(app_data) / "Granola"
-    elif os.uname().sysname == "Darwin":
+    elif sys.platform == "darwin":
         return Path.home() / "Library" / "Application Support" / "Granola"
     else:
         return Path.home() / ".config" / "Granola"
 
 
+@functools.cache
 def get_token_file_path() -> Path:
     """Get the path to the Granola credentials file.
 
+    The path is resolved once per process, like the app directory it lives in.
+
     Returns:
         Path to the supabase.json file
     """
     return _get_granola_app_dir() / "supabase.json"
 
 
+def token_refresh_deadline_ms(workos_tokens: dict[str, Any]) -> float:
+    """Get the time at which the access token should be refreshed.
+
+    Args:
+        workos_tokens: The parsed workos_tokens object
+
+    Returns:
+        Unix time in milliseconds, TOKEN_REFRESH_BUFFER_SECONDS before expiry
+    """
+    token_obtained_at = workos_tokens.get("obtained_at", 0)
+    expires_in_ms = workos_tokens.get("expires_in", 0) * 1000
+    return token_obtained_at + expires_in_ms - TOKEN_REFRESH_BUFFER_SECONDS * 1000
+
+
 def is_token_expired(workos_tokens: dict[str, Any]) -> bool:
     """Check if the access token has expired or will expire soon.
 
@@ -45,13 +79,39 @@ def is_token_expired(workos_tokens: dict[str, Any]) -> bool:
     Returns:
         True if the token has expired or will expire within the buffer time
     """
-    current_time = time.time() * 1000  # Convert to milliseconds
-    token_obtained_at = workos_tokens.get("obtained_at", 0)
-    expires_in_ms = workos_tokens.get("expires_in", 0) * 1000
-    expiration_time = token_obtained_at + expires_in_ms
-    buffer_time = TOKEN_REFRESH_BUFFER_SECONDS * 1000
+    return time.time_ns() // 1_000_000 >= token_refresh_deadline_ms(workos_tokens)
+
+
+def _refresh_request(workos_tokens: dict[str, Any]) -> dict[str, Any]:
+    """Build the request arguments for a token refresh."""
+    return {
+        "url": f"{GRANOLA_API_BASE}/v1/refresh-access-token",
+        "headers": {
+            "Authorization": f"Bearer {workos_tokens['access_token']}",
+            "Content-Type": "application/json",
+        },
+        "json": {
+            "refresh_token": workos_tokens["refresh_token"],
+            "provider": "workos",
+        },
+    }
+
+
+def _apply_refresh(
+    workos_tokens: dict[str, Any], refresh_response: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge a refresh response into the existing workos_tokens."""
+    updated_tokens = {
+        **workos_tokens,
+        "access_token": refresh_response["access_token"],
+        "expires_in": refresh_response["expires_in"],
+        "token_type": refresh_response["token_type"],
+        "obtained_at": time.time_ns() // 1_000_000,
+        "refresh_token": refresh_response.get("refresh_token", workos_tokens["refresh_token"]),
+    }
 
-    return current_time >= (expiration_time - buffer_time)
+    logger.debug("access_token_refreshed")
+    return updated_tokens
 
 
 def refresh_access_token(workos_tokens: dict[str, Any]) -> dict[str, Any]:
@@ -68,84 +128,217 @@ def refresh_access_token(workos_tokens: dict[str, Any]) -> dict[str, Any]:
     """
     logger.debug("refreshing_access_token")
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(
-            "https://api.granola.ai/v1/refresh-access-token",
-            headers={
-                "Authorization": f"Bearer {workos_tokens['access_token']}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "refresh_token": workos_tokens["refresh_token"],
-                "provider": "workos",
-            },
-        )
+    with httpx.Client(timeout=30.0, verify=get_ssl_context()) as client:
+        response = client.post(**_refresh_request(workos_tokens))
         response.raise_for_status()
-        refresh_response = response.json()
+        refresh_response = orjson.loads(response.content)
 
-    updated_tokens = {
-        **workos_tokens,
-        "access_token": refresh_response["access_token"],
-        "expires_in": refresh_response["expires_in"],
-        "token_type": refresh_response["token_type"],
-        "obtained_at": int(time.time() * 1000),
-        "refresh_token": refresh_response.get("refresh_token", workos_tokens["refresh_token"]),
-    }
+    return _apply_refresh(workos_tokens, refresh_response)
 
-    logger.debug("access_token_refreshed")
-    return updated_tokens
 
+async def refresh_access_token_async(
+    workos_tokens: dict[str, Any], client: Optional[httpx.AsyncClient] = None
+) -> dict[str, Any]:
+    """Refresh the access token over an async HTTP client.
 
-def get_granola_token() -> str:
-    """Get the Granola authentication token from the local storage.
+    Args:
+        workos_tokens: The current workos_tokens object
+        client: HTTP client to send the request with; the shared one if not given
 
-    The token is stored by the Granola desktop app in supabase.json.
-    If the token has expired, it will be refreshed automatically.
+    Returns:
+        Updated workos_tokens with new access token
+
+    Raises:
+        httpx.HTTPStatusError: If the refresh request fails
+    """
+    logger.debug("refreshing_access_token")
+
+    client = client or get_shared_client()
+    response = await client.post(**_refresh_request(workos_tokens))
+    response.raise_for_status()
+
+    return _apply_refresh(workos_tokens, orjson.loads(response.content))
+
+
+def clear_token_cache() -> None:
+    """Forget cached credentials so the next get_granola_token() re-reads supabase.json."""
+    global _cached_workos_tokens, _cached_token_file_mtime
+    _cached_workos_tokens = None
+    _cached_token_file_mtime = None
+
+
+def load_workos_tokens() -> dict[str, Any]:
+    """Load the workos_tokens stored by the Granola desktop app in supabase.json.
+
+    Cached tokens are returned without re-parsing the file while they are still
+    valid and the file hasn't been modified since they were read (e.g. by the
+    Granola app after a re-login). The returned tokens may have expired;
+    callers refresh them.
 
     Returns:
-        The authentication token
+        The parsed workos_tokens object
 
     Raises:
         FileNotFoundError: If the token file doesn't exist
         ValueError: If the token cannot be found in the file
     """
+    global _cached_workos_tokens, _cached_token_file_mtime
+
     token_path = get_token_file_path()
 
-    if not token_path.exists():
+    try:
+        mtime = token_path.stat().st_mtime_ns
+        if (
+            _cached_workos_tokens is not None
+            and mtime == _cached_token_file_mtime
+            and not is_token_expired(_cached_workos_tokens)
+        ):
+            return _cached_workos_tokens
+
+        token_data = orjson.loads(token_path.read_bytes())
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Granola credentials not found at {token_path}. "
             "Make sure the Granola app is installed and you are logged in."
-        )
-
-    with open(token_path) as f:
-        token_data = json.load(f)
+        ) from None
 
-    workos_tokens_str = token_data.get("workos_tokens")
-    if not workos_tokens_str:
+    workos_tokens = token_data.get("workos_tokens")
+    if not workos_tokens:
         raise ValueError("Could not find workos_tokens in Granola credentials file")
 
-    workos_tokens = json.loads(workos_tokens_str)
+    # The Granola app stores the tokens as a JSON string inside the JSON file;
+    # accept them as a nested object too
+    if isinstance(workos_tokens, str):
+        workos_tokens = orjson.loads(workos_tokens)
 
-    token = workos_tokens.get("access_token")
-    if not token:
+    if not workos_tokens.get("access_token"):
         raise ValueError("Could not find access_token in Granola credentials")
 
+    _cached_workos_tokens = workos_tokens
+    _cached_token_file_mtime = mtime
+    return workos_tokens
+
+
+def _refresh_failed(error: Exception) -> ValueError:
+    """Build the error raised when an expired token can't be refreshed."""
+    return ValueError(
+        f"Access token has expired and refresh failed: {error}. "
+        "Please re-authenticate in the Granola app."
+    )
+
+
+def get_granola_token() -> str:
+    """Get the Granola authentication token from the local storage.
+
+    The token is stored by the Granola desktop app in supabase.json.
+    If the token has expired, it will be refreshed automatically.
+    The parsed (or refreshed) tokens are cached in-process until they expire.
+
+    Returns:
+        The authentication token
+
+    Raises:
+        FileNotFoundError: If the token file doesn't exist
+        ValueError: If the token cannot be found in the file
+    """
+    global _cached_workos_tokens
+
+    workos_tokens = load_workos_tokens()
+
     if is_token_expired(workos_tokens):
         logger.debug("token_expired_refreshing")
         try:
             workos_tokens = refresh_access_token(workos_tokens)
-            token = workos_tokens["access_token"]
         except Exception as e:
-            raise ValueError(
-                f"Access token has expired and refresh failed: {e}. "
-                "Please re-authenticate in the Granola app."
-            ) from e
+            raise _refresh_failed(e) from e
+
+    _cached_workos_tokens = workos_tokens
+    return workos_tokens["access_token"]
+
+
+@functools.cache
+def get_ssl_context() -> ssl.SSLContext:
+    """Get the TLS context shared by every HTTP client this package creates.
+
+    Building a context loads the CA bundle from disk, so it is done once per
+    process rather than once per client.
+
+    Returns:
+        The shared SSL context
+    """
+    return httpx.create_ssl_context()
+
+
+def create_http_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """Create an HTTP/2 capable client with a long-lived connection pool.
+
+    Args:
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        timeout: Request timeout in seconds
 
-    return token
+    Returns:
+        A new HTTP client
+    """
+    return httpx.AsyncClient(
+        headers={"Content-Type": "application/json"},
+        timeout=httpx.Timeout(timeout, connect=10.0),
+        transport=httpx.AsyncHTTPTransport(
+            verify=get_ssl_context(),
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                max_connections=max_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        ),
+    )
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client for the Granola API, creating it if needed.
+
+    Credentials are sent per request rather than baked into the client, so a
+    single connection pool serves every GranolaClient and survives token refreshes.
+
+    Returns:
+        The shared HTTP client
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_http_client()
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide HTTP client, if one was created.
+
+    GranolaClient.close() leaves the shared client open for other instances, so
+    this is called once when the event loop that used it is about to end.
+    """
+    global _shared_client
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.aclose()
 
 
 class GranolaCacheReader:
-    """Reads folder and document data from the local Granola app cache."""
+    """Reads folder and document data from the local Granola app cache.
+
+    The cache file is parsed on first use and kept for the lifetime of the
+    reader, so create a new reader to pick up changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache reader."""
+        self._state: Optional[dict[str, Any]] = None
+        # Folder title -> list ID, built from the cache on first lookup
+        self._list_ids_by_title: Optional[dict[str, str]] = None
 
     def get_cache_paths(self) -> list[Path]:
         """Return candidate cache paths, newest format first."""
@@ -153,15 +346,20 @@ class GranolaCacheReader:
         return [app_dir / name for name in CACHE_FILENAMES]
 
     def read_cache(self) -> dict:
+        if self._state is not None:
+            return self._state
+
         paths = self.get_cache_paths()
 
         outer = None
         for cache_path in paths:
-            if cache_path.exists():
-                logger.debug("reading_cache", path=str(cache_path))
-                with open(cache_path) as f:
-                    outer = json.load(f)
-                break
+            try:
+                raw = cache_path.read_bytes()
+            except FileNotFoundError:
+                continue
+            logger.debug("reading_cache", path=str(cache_path))
+            outer = orjson.loads(raw)
+            break
 
         if outer is None:
             raise FileNotFoundError(
@@ -171,11 +369,12 @@ class GranolaCacheReader:
         # Structure: {"cache": "<JSON string>" | {dict}} -> {"state": {...}, "version": N}
         cache = outer.get("cache", outer)
         if isinstance(cache, str):
-            cache = json.loads(cache)
+            cache = orjson.loads(cache)
 
         state = cache.get("state", cache)
         if isinstance(state, str):
-            state = json.loads(state)
+            state = orjson.loads(state)
+        self._state = state
         return state
 
     def get_folders(self) -> list[dict[str, Any]]:
@@ -202,10 +401,22 @@ class GranolaCacheReader:
         return state.get("documents", {}).get(doc_id)
 
     def get_documents_for_folder(self, folder_title: str) -> list[dict[str, Any]]:
-        for folder in self.get_folders():
-            if folder["title"] == folder_title:
-                return folder["documents"]
-        return []
+        state = self.read_cache()
+
+        if self._list_ids_by_title is None:
+            list_ids: dict[str, str] = {}
+            for list_id, meta in state.get("documentListsMetadata", {}).items():
+                # First folder with a given title wins, as with a scan of get_folders()
+                list_ids.setdefault(meta.get("title", ""), list_id)
+            self._list_ids_by_title = list_ids
+
+        list_id = self._list_ids_by_title.get(folder_title)
+        if list_id is None:
+            return []
+
+        documents = state.get("documents", {})
+        doc_ids = state.get("documentLists", {}).get(list_id, [])
+        return [documents[did] for did in doc_ids if did in documents]
 
     def get_folder_map(self) -> dict[str, str]:
         """Return a mapping of folder title to folder ID from the cache.
@@ -225,16 +436,30 @@ class GranolaCacheReader:
 class GranolaClient:
     """Client for interacting with the Granola API."""
 
-    def __init__(self, token: Optional[str] = None, base_url: str = GRANOLA_API_BASE):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = GRANOLA_API_BASE,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize the Granola API client.
 
         Args:
             token: Authentication token. If not provided, will be loaded from local storage.
             base_url: Base URL for the API.
+            client: HTTP client to use instead of the shared one. The caller
+                owns it and is responsible for closing it.
         """
         self._token = token
         self.base_url = base_url
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+        # Computed once per token so the per-request check is a single compare
+        self._refresh_deadline_ms = math.inf
+        self._refresh_lock = asyncio.Lock()
+        # (limit, offset, include_last_viewed_panel) -> (ETag, documents) of the
+        # last get_documents response, revalidated with If-None-Match
+        self._document_pages: dict[tuple[int, int, bool], tuple[str, list[dict[str, Any]]]] = {}
 
     @property
     def token(self) -> str:
@@ -243,23 +468,80 @@ class GranolaClient:
             self._token = get_granola_token()
         return self._token
 
+    def _current_token(self) -> Optional[str]:
+        """Return the token if it is usable as-is, otherwise None."""
+        if time.time_ns() // 1_000_000 >= self._refresh_deadline_ms:
+            return None
+        return self._token
+
+    async def _ensure_token(self) -> str:
+        """Get a valid authentication token, loading or refreshing it if necessary.
+
+        Concurrent requests that all find the token missing or expired wait on a
+        lock, and only the first of them loads or refreshes it. supabase.json is
+        checked on every load, so tokens the Granola app rotates are picked up.
+
+        Returns:
+            The authentication token
+
+        Raises:
+            FileNotFoundError: If the token file doesn't exist
+            ValueError: If the token is missing or can't be refreshed
+        """
+        global _cached_workos_tokens
+
+        token = self._current_token()
+        if token is not None:
+            return token
+
+        async with self._refresh_lock:
+            # Another request may have refreshed it while we were waiting
+            token = self._current_token()
+            if token is not None:
+                return token
+
+            workos_tokens = load_workos_tokens()
+            if is_token_expired(workos_tokens):
+                logger.debug("token_expired_refreshing")
+                try:
+                    workos_tokens = await refresh_access_token_async(
+                        workos_tokens, client=await self._get_client()
+                    )
+                except Exception as e:
+                    # The app may have written new tokens since they were loaded
+                    clear_token_cache()
+                    workos_tokens = load_workos_tokens()
+                    if is_token_expired(workos_tokens):
+                        raise _refresh_failed(e) from e
+                    logger.info("token_reloaded_after_refresh_failure")
+
+            _cached_workos_tokens = workos_tokens
+            self._refresh_deadline_ms = token_refresh_deadline_ms(workos_tokens)
+            self._token = workos_tokens["access_token"]
+            return self._token
+
+    async def _auth_headers(self) -> dict[str, str]:
+        """Per-request authentication headers for the current token."""
+        return {"Authorization": f"Bearer {await self._ensure_token()}"}
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
+        """Get the HTTP client given to the constructor, or the shared one.
+
+        The client lives until close() is called, so its connection pool is
+        reused across sync cycles.
+        """
+        if self._owns_client:
+            self._client = get_shared_client()
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """Release the HTTP client.
+
+        Neither client is closed here: one given to the constructor belongs to
+        the caller, and the shared one is closed by close_shared_client().
+        """
+        if self._owns_client:
+            self._client = None
 
     async def get_folders(self) -> list[dict[str, Any]]:
         """Get all folders (document lists) from Granola.
@@ -286,10 +568,12 @@ class GranolaClient:
             client = await self._get_client()
             logger.debug("fetching_folders")
 
-            response = await client.get("/v2/get-document-lists")
+            response = await client.get(
+                f"{self.base_url}/v2/get-document-lists", headers=await self._auth_headers()
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             folders = data.get("lists", [])
             logger.debug("folders_fetched", count=len(folders))
             return folders
@@ -316,7 +600,8 @@ class GranolaClient:
         logger.debug("fetching_documents_by_folder", list_id=list_id, limit=limit, offset=offset)
 
         response = await client.post(
-            "/v2/get-documents",
+            f"{self.base_url}/v2/get-documents",
+            headers=await self._auth_headers(),
             json={
                 "list_id": list_id,
                 "limit": limit,
@@ -325,7 +610,7 @@ class GranolaClient:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         documents = data.get("docs", []) if isinstance(data, dict) else data
         logger.debug("folder_documents_fetched", list_id=list_id, count=len(documents))
         return documents
@@ -335,6 +620,9 @@ class GranolaClient:
     ) -> list[dict[str, Any]]:
         """Get recent documents from Granola.
 
+        If the API sent an ETag for the same page before, the request is made
+        conditional and a 304 Not Modified response reuses the previous result.
+
         Args:
             limit: Maximum number of documents to fetch per page
             offset: Number of documents to skip (for pagination)
@@ -346,51 +634,78 @@ class GranolaClient:
         client = await self._get_client()
         logger.debug("fetching_documents", limit=limit, offset=offset)
 
+        page_key = (limit, offset, include_last_viewed_panel)
+        cached_page = self._document_pages.get(page_key)
+        headers = await self._auth_headers()
+        if cached_page is not None:
+            headers["If-None-Match"] = cached_page[0]
+
         response = await client.post(
-            "/v2/get-documents",
+            f"{self.base_url}/v2/get-documents",
+            headers=headers,
             json={
                 "limit": limit,
                 "offset": offset,
                 "include_last_viewed_panel": include_last_viewed_panel,
             },
         )
+        if response.status_code == 304 and cached_page is not None:
+            logger.debug("documents_not_modified", offset=offset)
+            return list(cached_page[1])
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         documents = data.get("docs", data) if isinstance(data, dict) else data
         logger.debug("documents_fetched", count=len(documents))
-        return documents
+
+        etag = response.headers.get("etag")
+        if etag:
+            self._document_pages[page_key] = (etag, documents)
+        else:
+            self._document_pages.pop(page_key, None)
+        return list(documents)
 
     async def get_all_documents(
-        self, page_size: int = 100, include_last_viewed_panel: bool = True
+        self,
+        page_size: int = 100,
+        include_last_viewed_panel: bool = True,
+        concurrency: int = 4,
     ) -> list[dict[str, Any]]:
         """Get all documents from Granola with pagination.
 
+        After the first page, the next ``concurrency`` pages are requested at
+        once; pages after the first short page are discarded.
+
         Args:
             page_size: Number of documents to fetch per page
             include_last_viewed_panel: Whether to include document content
+            concurrency: Number of pages to request at a time
 
         Returns:
             List of all document objects
         """
-        documents: list[dict[str, Any]] = []
-        offset = 0
-
-        while True:
-            page = await self.get_documents(
-                limit=page_size,
-                offset=offset,
-                include_last_viewed_panel=include_last_viewed_panel,
-            )
-            if not page:
-                break
-
-            documents.extend(page)
-
-            if len(page) < page_size:
-                break
-
-            offset += page_size
+        page = await self.get_documents(
+            limit=page_size,
+            offset=0,
+            include_last_viewed_panel=include_last_viewed_panel,
+        )
+        documents: list[dict[str, Any]] = list(page)
+        offset = page_size
+
+        while len(page) == page_size:
+            pages = await asyncio.gather(*(
+                self.get_documents(
+                    limit=page_size,
+                    offset=page_offset,
+                    include_last_viewed_panel=include_last_viewed_panel,
+                )
+                for page_offset in range(offset, offset + concurrency * page_size, page_size)
+            ))
+            for page in pages:
+                documents.extend(page)
+                if len(page) < page_size:
+                    break
+            offset += concurrency * page_size
 
         return documents
 
@@ -406,14 +721,50 @@ class GranolaClient:
         client = await self._get_client()
         logger.debug("fetching_transcript", doc_id=doc_id)
 
-        response = await client.post(
-            "/v1/get-document-transcript",
+        # Stream the body into a local buffer so the raw bytes are not also cached
+        # on the Response and can be freed as soon as they've been parsed
+        body = bytearray()
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/v1/get-document-transcript",
+            headers=await self._auth_headers(),
             json={"document_id": doc_id},
-        )
-        response.raise_for_status()
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                body += chunk
 
-        data = response.json()
+        data = orjson.loads(body)
+        del body
         # The API returns the transcript array directly
         transcript = data if isinstance(data, list) else data.get("transcript", [])
         logger.debug("transcript_fetched", doc_id=doc_id, segments=len(transcript))
         return transcript
+
+    async def get_transcripts_bulk(
+        self, doc_ids: list[str], concurrency: int = DEFAULT_FETCH_CONCURRENCY
+    ) -> dict[str, list[dict[str, Any]] | BaseException]:
+        """Fetch transcripts for several documents concurrently.
+
+        Requests are multiplexed over the shared client, with at most
+        ``concurrency`` in flight at a time. A failed fetch does not cancel
+        the others; its exception is returned in place of the transcript.
+
+        Args:
+            doc_ids: The document IDs
+            concurrency: Maximum number of concurrent requests
+
+        Returns:
+            Dict mapping each document ID to its transcript or the exception
+            raised while fetching it
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(doc_id: str) -> list[dict[str, Any]]:
+            async with sem:
+                return await self.get_transcript(doc_id)
+
+        results = await asyncio.gather(
+            *(fetch(doc_id) for doc_id in doc_ids), return_exceptions=True
+        )
+        return dict(zip(doc_ids, results))
@@ -4,11 +4,17 @@ import logging
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 import structlog
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
@@ -45,13 +51,19 @@ def setup_logging(
         force=True,
     )
 
-    # Configure structlog
+    # Configure structlog. Events below log_level are dropped by the filtering
+    # bound logger before any processor runs.
+    if sys.stdout.isatty():
+        renderer = structlog.dev.ConsoleRenderer()
+    else:
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer() if sys.stdout.isatty() else structlog.processors.JSONRenderer(),
+            renderer,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
@@ -1,10 +1,12 @@
 """JSON state management for tracking synced documents."""
 
-import json
+import asyncio
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 import structlog
 
 logger = structlog.get_logger()
@@ -21,6 +23,13 @@ class StateManager:
         """
         self.state_file = Path(state_file).expanduser()
         self._state: dict[str, Any] = self._default_state()
+        # Whether there are changes that haven't been written to disk yet
+        self._dirty = False
+        # Keeps asave() writes in order when several are in flight
+        self._save_lock = asyncio.Lock()
+        # In-memory indexes over seen_documents for the per-document hot path
+        self._seen_ids: set[str] = set()
+        self._last_updated: dict[str, Optional[str]] = {}
         self._load()
 
     def _default_state(self) -> dict[str, Any]:
@@ -43,20 +52,36 @@ class StateManager:
 
     def _load(self) -> None:
         """Load state from file."""
-        if not self.state_file.exists():
-            logger.debug("state_file_not_found", path=str(self.state_file))
-            return
-
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
-            self._state = data
+            self._state = orjson.loads(self.state_file.read_bytes())
             self._migrate()
+            self._build_indexes()
             logger.debug("state_loaded", path=str(self.state_file))
-        except (json.JSONDecodeError, IOError) as e:
+        except FileNotFoundError:
+            logger.debug("state_file_not_found", path=str(self.state_file))
+            self._dirty = True
+        except orjson.JSONDecodeError as e:
+            logger.warning("state_load_error", error=str(e), path=str(self.state_file))
+            # Keep default state, setting the unreadable file aside for inspection
+            # rather than letting the next save overwrite it
+            self._quarantine_state_file()
+        except OSError as e:
             logger.warning("state_load_error", error=str(e), path=str(self.state_file))
             # Keep default state
 
+    def _quarantine_state_file(self) -> None:
+        """Rename an unreadable state file to state.json.corrupt.<timestamp>."""
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        corrupt_file = self.state_file.with_name(f"{self.state_file.name}.corrupt.{stamp}")
+        try:
+            os.replace(self.state_file, corrupt_file)
+        except OSError as e:
+            logger.warning("state_quarantine_failed", error=str(e), path=str(self.state_file))
+            return
+
+        logger.warning("state_file_quarantined", path=str(corrupt_file))
+        self._dirty = True
+
     def _migrate(self) -> None:
         """Migrate state from older versions."""
         version = self._state.get("version", 1)
@@ -64,20 +89,78 @@ class StateManager:
             self._state.setdefault("folder_map", {})
             self._state.setdefault("pending_documents", {})
             self._state["version"] = 2
+            self._dirty = True
             logger.info("state_migrated", from_version=version, to_version=2)
 
+    def _build_indexes(self) -> None:
+        """Rebuild the in-memory indexes from seen_documents."""
+        seen_documents = self._state["seen_documents"]
+        self._seen_ids = set(seen_documents)
+        self._last_updated = {
+            doc_id: seen.get("last_updated") for doc_id, seen in seen_documents.items()
+        }
+
     def save(self) -> None:
-        """Save state to file."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        """Save state to file.
+
+        The state is written to a temporary file which then replaces the state
+        file, so a crash mid-write leaves the previous state intact.
+        """
+        self._write(self._snapshot())
+
+    async def asave(self) -> None:
+        """Save state to file without blocking the event loop.
+
+        The state is serialized on the calling thread, so it can't change
+        mid-write, and the file is written from a worker thread. Saves made
+        through asave() are applied in order.
+        """
+        async with self._save_lock:
+            await asyncio.to_thread(self._write, self._snapshot())
 
+    def _snapshot(self) -> bytes:
+        """Serialize the state for writing and mark it as saved.
+
+        Returns:
+            The state file contents
+        """
         # Update last_sync timestamp
         self._state["last_sync"] = datetime.now(timezone.utc).isoformat()
 
-        with open(self.state_file, "w") as f:
-            json.dump(self._state, f, indent=2)
+        data = orjson.dumps(self._state, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        self._dirty = False
+        return data
+
+    def _write(self, data: bytes) -> None:
+        """Atomically replace the state file.
+
+        Args:
+            data: The state file contents
+        """
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.state_file)
+        except OSError:
+            # Nothing was saved, so the next flush must try again
+            self._dirty = True
+            raise
 
         logger.debug("state_saved", path=str(self.state_file))
 
+    async def aflush(self) -> bool:
+        """Save state to file, off the event loop, if it has changed since the last save.
+
+        Returns:
+            True if the state was written
+        """
+        if not self._dirty:
+            return False
+
+        await self.asave()
+        return True
+
     def is_document_seen(self, doc_id: str) -> bool:
         """Check if a document has been synced.
 
@@ -87,7 +170,7 @@ class StateManager:
         Returns:
             True if the document has been successfully synced
         """
-        return doc_id in self._state["seen_documents"]
+        return doc_id in self._seen_ids
 
     def is_document_updated(self, doc_id: str, updated_at: str) -> bool:
         """Check if a document has been updated since last sync.
@@ -99,11 +182,10 @@ class StateManager:
         Returns:
             True if the document has been updated since last sync
         """
-        if doc_id not in self._state["seen_documents"]:
+        if doc_id not in self._seen_ids:
             return True
 
-        seen = self._state["seen_documents"][doc_id]
-        return seen.get("last_updated") != updated_at
+        return self._last_updated[doc_id] != updated_at
 
     def mark_synced(
         self,
@@ -119,15 +201,18 @@ class StateManager:
             folder_name: The folder the document belongs to
         """
         now = datetime.now(timezone.utc).isoformat()
+        last_updated = doc.get("updated_at") or doc.get("created_at")
 
         self._state["seen_documents"][doc_id] = {
             "title": doc.get("title", "Untitled"),
             "folder_name": folder_name,
             "first_seen": self._state["seen_documents"].get(doc_id, {}).get("first_seen", now),
-            "last_updated": doc.get("updated_at") or doc.get("created_at"),
+            "last_updated": last_updated,
             "synced_at": now,
             "webhook_status": "success",
         }
+        self._seen_ids.add(doc_id)
+        self._last_updated[doc_id] = last_updated
 
         # Remove from failed if it was there
         self._state["failed_documents"].pop(doc_id, None)
@@ -137,6 +222,7 @@ class StateManager:
         if folder_name not in self._state["stats"]["by_folder"]:
             self._state["stats"]["by_folder"][folder_name] = {"synced": 0, "errors": 0}
         self._state["stats"]["by_folder"][folder_name]["synced"] += 1
+        self._dirty = True
 
         logger.debug("document_marked_synced", doc_id=doc_id, folder=folder_name)
 
@@ -174,6 +260,7 @@ class StateManager:
         if folder_name not in self._state["stats"]["by_folder"]:
             self._state["stats"]["by_folder"][folder_name] = {"synced": 0, "errors": 0}
         self._state["stats"]["by_folder"][folder_name]["errors"] += 1
+        self._dirty = True
 
         logger.debug(
             "document_marked_failed",
@@ -199,6 +286,7 @@ class StateManager:
             "folder_id": folder_id,
             "last_sync": now,
         })
+        self._dirty = True
 
     def get_failed_documents(self) -> dict[str, Any]:
         """Get all failed documents.
@@ -222,7 +310,7 @@ class StateManager:
         Returns:
             Set of document IDs
         """
-        return set(self._state["seen_documents"].keys())
+        return set(self._seen_ids)
 
     def get_folder_map(self) -> dict[str, str]:
         """Get the persisted folder name → ID mapping.
@@ -238,7 +326,12 @@ class StateManager:
         Args:
             mapping: Dict mapping folder titles to their IDs
         """
-        self._state.setdefault("folder_map", {}).update(mapping)
+        folder_map = self._state.setdefault("folder_map", {})
+        if folder_map.items() >= mapping.items():
+            return
+
+        folder_map.update(mapping)
+        self._dirty = True
         logger.debug("folder_map_updated", count=len(mapping))
 
     def mark_pending(
@@ -264,6 +357,7 @@ class StateManager:
             "last_checked": now,
             "check_count": existing.get("check_count", 0) + 1,
         }
+        self._dirty = True
         logger.debug("document_marked_pending", doc_id=doc_id, folder=folder_name)
 
     def get_pending_documents(self) -> list[dict[str, Any]]:
@@ -283,7 +377,8 @@ class StateManager:
         Args:
             doc_id: The document ID to clear
         """
-        self._state.get("pending_documents", {}).pop(doc_id, None)
+        if self._state.get("pending_documents", {}).pop(doc_id, None) is not None:
+            self._dirty = True
         logger.debug("pending_cleared", doc_id=doc_id)
 
     def is_document_pending(self, doc_id: str) -> bool:
@@ -300,4 +395,6 @@ class StateManager:
     def clear(self) -> None:
         """Clear all state (useful for testing or resetting)."""
         self._state = self._default_state()
+        self._build_indexes()
+        self._dirty = True
         logger.info("state_cleared")
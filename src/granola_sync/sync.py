@@ -1,17 +1,54 @@
 """Main sync loop logic."""
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any, Optional
 
+import httpx
 import structlog
 
 from .config import Config
-from .granola_api import GranolaCacheReader, GranolaClient
+from .granola_api import GranolaCacheReader, GranolaClient, create_http_client
 from .state import StateManager
 from .webhook import WebhookSender
 
 logger = structlog.get_logger()
 
+# Documents whose rendered payload is kept for reuse across cycles
+PAYLOAD_CACHE_SIZE = 256
+
+# Link to a note in the Granola web app, followed by the document ID
+GRANOLA_NOTE_URL_PREFIX = "https://notes.granola.ai/d/"
+
+# Seconds stop() waits for queued webhooks before abandoning them
+DISPATCH_DRAIN_TIMEOUT = 60
+
+
+def _participants_from_attendees(people: dict[str, Any]) -> list[str]:
+    """Extract names from the new API structure: people.attendees of {name, email}."""
+    return [
+        name
+        for attendee in people.get("attendees", [])
+        if (name := attendee.get("name") or attendee.get("email"))
+    ]
+
+
+def _participants_from_people(people: list[dict[str, Any]]) -> list[str]:
+    """Extract names from the legacy structure, where people is an array."""
+    return [
+        name
+        for person in people
+        if (name := person.get("display_name") or person.get("name"))
+    ]
+
+
+# Participant extraction keyed on the decoded JSON type of a document's "people"
+_PARTICIPANT_EXTRACTORS: dict[type, Callable[[Any], list[str]]] = {
+    dict: _participants_from_attendees,
+    list: _participants_from_people,
+}
+
 
 class SyncService:
     """Main service for syncing Granola documents to a webhook."""
@@ -32,32 +69,132 @@ class SyncService:
             state: Optional state manager (for testing)
         """
         self.config = config
-        self.granola = granola or GranolaClient()
+        # One connection pool for the Granola API and the webhook endpoint,
+        # only needed when this service creates one of them itself
+        self._http: Optional[httpx.AsyncClient] = None
+        if granola is None or webhook is None:
+            self._http = create_http_client(
+                max_connections=config.http.pool_size,
+                max_keepalive_connections=max(
+                    config.http.pool_size // 2, config.sync.concurrency
+                ),
+                timeout=config.http.timeout,
+            )
+        self.granola = granola or GranolaClient(client=self._http)
         self.webhook = webhook or WebhookSender(
             url=config.webhook.url,
             secret=config.webhook.secret,
             retry_attempts=config.sync.retry_attempts,
             retry_delay=config.sync.retry_delay,
+            client=self._http,
+            max_retry_delay=config.sync.max_retry_delay,
         )
         self.state = state or StateManager(config.state.file)
-        self._running = False
+        # Set by stop(); wakes run() from its wait between cycles
+        self._stop_event = asyncio.Event()
+        # Per-cycle limit on documents processed at once, shared by all folders
+        self._process_slots = asyncio.Semaphore(config.sync.concurrency)
+        # IDs of documents already taken by a folder in the current cycle
+        self._claimed_doc_ids: set[str] = set()
+        # Background webhook dispatch, only active while run() is looping
+        self._dispatch_queue: Optional[asyncio.Queue[tuple[list[dict[str, Any]], str]]] = None
+        self._dispatch_workers: list[asyncio.Task[None]] = []
+        # IDs of documents handed to the dispatcher and not yet processed
+        self._queued_doc_ids: set[str] = set()
+        # doc_id -> (updated_at, folder name, payload without transcript), LRU ordered
+        self._payload_cache: OrderedDict[str, tuple[str, str, dict[str, Any]]] = OrderedDict()
 
     async def run(self) -> None:
-        """Main sync loop - runs until stopped."""
-        self._running = True
+        """Main sync loop - runs until stopped.
+
+        Documents are handed to background webhook workers, so a slow webhook
+        doesn't hold up the next poll. A cycle is skipped while documents from
+        an earlier one are still queued. After stop() the queue is drained;
+        cancelling run() abandons queued documents for the next run instead.
+        """
+        self._stop_event.clear()
         logger.info("sync_started", folders=self.config.granola.folders)
+        self._start_dispatcher()
+        # Only a clean stop() waits for queued documents; cancellation doesn't
+        drain = False
 
         try:
-            while self._running:
-                try:
-                    await self.sync_once()
-                except Exception as e:
-                    logger.error("sync_error", error=str(e))
+            while not self._stop_event.is_set():
+                if self._queued_doc_ids:
+                    # The workers haven't caught up with the last cycle; polling
+                    # again would only pile more documents onto the queue
+                    logger.warning("sync_overrun_skipped", queued=len(self._queued_doc_ids))
+                else:
+                    try:
+                        await self.sync_once()
+                    except Exception as e:
+                        logger.error("sync_error", error=str(e))
 
-                await asyncio.sleep(self.config.sync.interval)
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=self.config.sync.interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            drain = True
         finally:
+            await self._stop_dispatcher(drain=drain)
             await self.close()
 
+    def _start_dispatcher(self) -> None:
+        """Start the background workers that process queued documents."""
+        self._dispatch_queue = asyncio.Queue(maxsize=self.config.sync.batch_size)
+        self._dispatch_workers = [
+            asyncio.create_task(self._dispatch_worker(self._dispatch_queue))
+            for _ in range(self.config.sync.concurrency)
+        ]
+
+    async def _dispatch_worker(
+        self, queue: asyncio.Queue[tuple[list[dict[str, Any]], str]]
+    ) -> None:
+        """Process queued documents until cancelled.
+
+        Args:
+            queue: Queue of (documents, folder name) groups to deliver
+        """
+        while True:
+            docs, folder_name = await queue.get()
+            try:
+                await self._deliver(docs, folder_name)
+            finally:
+                self._queued_doc_ids.difference_update(doc["id"] for doc in docs)
+                queue.task_done()
+
+    async def _stop_dispatcher(self, drain: bool = True) -> None:
+        """Stop the workers, first waiting for queued documents if asked to.
+
+        Documents abandoned in the queue are not marked synced, so the next run
+        picks them up again.
+
+        Args:
+            drain: Wait up to DISPATCH_DRAIN_TIMEOUT seconds for queued documents
+                to be processed before cancelling the workers
+        """
+        if self._dispatch_queue is None:
+            return
+
+        if drain:
+            try:
+                await asyncio.wait_for(
+                    self._dispatch_queue.join(), timeout=DISPATCH_DRAIN_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning("dispatch_drain_timeout", queued=len(self._queued_doc_ids))
+        for worker in self._dispatch_workers:
+            worker.cancel()
+        await asyncio.gather(*self._dispatch_workers, return_exceptions=True)
+        self._dispatch_queue = None
+        self._dispatch_workers = []
+        self._queued_doc_ids.clear()
+
+        # Persist the outcomes of documents processed since the last cycle
+        await self.state.aflush()
+
     async def sync_once(self, dry_run: bool = False) -> dict[str, Any]:
         """Perform a single sync cycle across all configured folders.
 
@@ -80,51 +217,65 @@ class SyncService:
             "documents_synced": 0,
             "documents_failed": 0,
             "documents_pending": 0,
+            "documents_queued": 0,
             "by_folder": {},
         }
 
         try:
-            # 1. Resolve folder name → ID mapping
-            folder_map = self._resolve_folder_map()
+            # 1. Resolve folder name → ID mapping. The local cache is read at most
+            # once per cycle, shared with the per-folder fallback below.
+            cache = GranolaCacheReader()
+            folder_map = self._resolve_folder_map(cache)
+
+            # 2. Fetch documents for each resolved folder concurrently
+            resolved = {
+                folder_name: folder_map[folder_name]
+                for folder_name in configured_folders
+                if folder_map.get(folder_name)
+            }
+            fetched = await asyncio.gather(*(
+                self._fetch_folder_documents(folder_name, folder_id, cache)
+                for folder_name, folder_id in resolved.items()
+            ))
+
+            # 3. Sync the folders concurrently, sharing one limit on documents in
+            # flight. Each folder claims its new documents before its first await,
+            # so a document in several folders goes to the first configured one.
+            self._process_slots = asyncio.Semaphore(self.config.sync.concurrency)
+            # Documents still queued from an earlier cycle are already taken
+            self._claimed_doc_ids = set(self._queued_doc_ids)
+            synced = await asyncio.gather(*(
+                self._sync_documents(folder_name, documents, dry_run=dry_run)
+                for folder_name, documents in zip(resolved, fetched)
+            ))
+            folder_summaries = dict(zip(resolved, synced))
 
-            # 2. Process each configured folder
             for folder_name in configured_folders:
-                folder_id = folder_map.get(folder_name)
-                if not folder_id:
+                folder_summary = folder_summaries.get(folder_name)
+                if folder_summary is None:
                     logger.warning("folder_id_not_resolved", name=folder_name)
-                    summary["by_folder"][folder_name] = {
+                    folder_summary = {
                         "total": 0,
                         "new": 0,
                         "synced": 0,
                         "failed": 0,
                         "pending": 0,
+                        "queued": 0,
                         "documents": [],
                     }
-                    continue
-
-                # Fetch documents from API with cache fallback
-                documents = await self._fetch_folder_documents(folder_name, folder_id)
-                summary["documents_found"] += len(documents)
-
-                # Sync documents in this folder
-                folder_summary = await self._sync_documents(
-                    folder_name, documents, dry_run=dry_run
-                )
                 summary["by_folder"][folder_name] = folder_summary
+                summary["documents_found"] += folder_summary["total"]
                 summary["documents_new"] += folder_summary["new"]
                 summary["documents_synced"] += folder_summary["synced"]
                 summary["documents_failed"] += folder_summary["failed"]
                 summary["documents_pending"] += folder_summary.get("pending", 0)
+                summary["documents_queued"] += folder_summary.get("queued", 0)
 
-            # 3. Re-check documents that were previously pending content
+            # 4. Re-check documents that were previously pending content
             pending_summary = await self._recheck_pending_documents(dry_run=dry_run)
             summary["documents_synced"] += pending_summary["synced"]
             summary["documents_failed"] += pending_summary["failed"]
 
-            # 4. Save state (unless dry run)
-            if not dry_run:
-                self.state.save()
-
             logger.info(
                 "sync_cycle_completed",
                 folders_checked=summary["folders_checked"],
@@ -133,15 +284,22 @@ class SyncService:
                 synced=summary["documents_synced"],
                 failed=summary["documents_failed"],
                 pending=summary["documents_pending"],
+                queued=summary["documents_queued"],
             )
 
         except Exception as e:
             logger.error("sync_cycle_error", error=str(e))
             raise
 
+        finally:
+            # 5. Save state (unless dry run), including progress made before a
+            # failure, so documents that were already delivered aren't resent
+            if not dry_run:
+                await self.state.aflush()
+
         return summary
 
-    def _resolve_folder_map(self) -> dict[str, str]:
+    def _resolve_folder_map(self, cache: Optional[GranolaCacheReader] = None) -> dict[str, str]:
         """Resolve folder names to IDs from multiple sources.
 
         Priority order:
@@ -149,6 +307,9 @@ class SyncService:
         2. Persisted mapping from state.json (folder_map)
         3. Live read from cache-v4.json (updates state)
 
+        Args:
+            cache: Cache reader to use; a new one is created if not given
+
         Returns:
             Dict mapping folder titles to their IDs
         """
@@ -156,7 +317,7 @@ class SyncService:
 
         # Priority 3 (lowest): Read from cache file
         try:
-            cache = GranolaCacheReader()
+            cache = cache or GranolaCacheReader()
             cache_map = cache.get_folder_map()
             folder_map.update(cache_map)
             # Persist for future use even if cache becomes unavailable
@@ -177,13 +338,14 @@ class SyncService:
         return folder_map
 
     async def _fetch_folder_documents(
-        self, folder_name: str, folder_id: str
+        self, folder_name: str, folder_id: str, cache: Optional[GranolaCacheReader] = None
     ) -> list[dict[str, Any]]:
         """Fetch documents for a folder, API-first with cache fallback.
 
         Args:
             folder_name: The folder title (for cache fallback)
             folder_id: The folder/list ID (for API call)
+            cache: Cache reader to fall back to; a new one is created if not given
 
         Returns:
             List of document objects
@@ -199,7 +361,7 @@ class SyncService:
                 error=str(api_error),
             )
             try:
-                cache = GranolaCacheReader()
+                cache = cache or GranolaCacheReader()
                 documents = cache.get_documents_for_folder(folder_name)
                 logger.debug("documents_from_cache", folder=folder_name, count=len(documents))
                 return documents
@@ -234,11 +396,17 @@ class SyncService:
             "synced": 0,
             "failed": 0,
             "pending": 0,
+            "queued": 0,
             "documents": [],
         }
 
-        # Find new/updated documents
-        new_docs = self._filter_new_documents(documents)
+        # Find new/updated documents. A document in several folders is only
+        # handled by the first folder that claims it this cycle.
+        new_docs = [
+            doc
+            for doc in self._filter_new_documents(documents)
+            if doc["id"] not in self._claimed_doc_ids
+        ]
         summary["new"] = len(new_docs)
 
         logger.info(
@@ -249,16 +417,42 @@ class SyncService:
             dry_run=dry_run,
         )
 
-        # Process each new document
-        for doc in new_docs[: self.config.sync.batch_size]:
-            if dry_run:
-                summary["documents"].append({
-                    "id": doc["id"],
-                    "title": doc.get("title", "Untitled"),
-                    "action": "would_sync",
-                })
-                summary["synced"] += 1
-            elif not self._has_content(doc):
+        batch = new_docs[: self.config.sync.batch_size]
+        self._claimed_doc_ids.update(doc["id"] for doc in batch)
+
+        # A dry run only reports the batch: no content checks, transcripts or payloads
+        if dry_run:
+            summary["documents"] = [
+                {"id": doc["id"], "title": doc.get("title", "Untitled"), "action": "would_sync"}
+                for doc in batch
+            ]
+            summary["synced"] = len(batch)
+            return summary
+
+        # Fetch transcripts and send webhooks for documents with content, either
+        # through the background dispatcher or concurrently here. The outcome is
+        # None for queued documents; _process_document handles its own errors.
+        outcomes: dict[str, Optional[bool]] = {}
+        groups = self._delivery_groups([doc for doc in batch if self._has_content(doc)])
+        if self._dispatch_queue is not None:
+            for group in groups:
+                self._queued_doc_ids.update(doc["id"] for doc in group)
+                await self._dispatch_queue.put((group, folder_label))
+                outcomes.update((doc["id"], None) for doc in group)
+        else:
+            async def process(group: list[dict[str, Any]]) -> list[bool]:
+                async with self._process_slots:
+                    return await self._deliver(group, folder_label)
+
+            results = await asyncio.gather(*(process(group) for group in groups))
+            for group, group_results in zip(groups, results):
+                outcomes.update(
+                    (doc["id"], success) for doc, success in zip(group, group_results)
+                )
+
+        # Record the outcome of each new document
+        for doc in batch:
+            if doc["id"] not in outcomes:
                 # No content yet — mark as pending for re-check later
                 self.state.mark_pending(doc["id"], doc, folder_label)
                 summary["documents"].append({
@@ -273,8 +467,15 @@ class SyncService:
                     title=doc.get("title"),
                     folder=folder_label,
                 )
+            elif outcomes[doc["id"]] is None:
+                summary["documents"].append({
+                    "id": doc["id"],
+                    "title": doc.get("title", "Untitled"),
+                    "action": "queued",
+                })
+                summary["queued"] += 1
             else:
-                success = await self._process_document(doc, folder_label)
+                success = outcomes[doc["id"]]
                 summary["documents"].append({
                     "id": doc["id"],
                     "title": doc.get("title", "Untitled"),
@@ -298,20 +499,14 @@ class SyncService:
         Returns:
             List of documents that need syncing
         """
-        new_docs = []
-        for doc in documents:
-            doc_id = doc.get("id")
-            if not doc_id:
-                continue
-
-            updated_at = doc.get("updated_at") or doc.get("created_at")
-
-            if not self.state.is_document_seen(doc_id):
-                new_docs.append(doc)
-            elif self.state.is_document_updated(doc_id, updated_at):
-                new_docs.append(doc)
-
-        return new_docs
+        # is_document_updated() is also True for documents that were never seen
+        is_updated = self.state.is_document_updated
+        return [
+            doc
+            for doc in documents
+            if (doc_id := doc.get("id"))
+            and is_updated(doc_id, doc.get("updated_at") or doc.get("created_at"))
+        ]
 
     def _has_content(self, doc: dict[str, Any]) -> bool:
         """Check if a document has meaningful note content.
@@ -362,8 +557,8 @@ class SyncService:
     ) -> dict[str, Any]:
         """Re-check documents previously skipped due to missing content.
 
-        Fetches each pending document from the API and processes it
-        if content has appeared since it was first seen.
+        Fetches the most recent documents from the API once and processes
+        each pending document whose content has appeared since it was first seen.
 
         Args:
             dry_run: If True, don't send webhooks
@@ -379,14 +574,20 @@ class SyncService:
 
         logger.info("rechecking_pending_documents", count=len(pending))
 
+        # One page of recent documents covers every pending ID, so fetch it once
+        try:
+            docs = await self.granola.get_documents(limit=100, offset=0)
+        except Exception as e:
+            logger.warning("pending_recheck_error", error=str(e))
+            return result
+        docs_by_id = {d.get("id"): d for d in docs}
+
         for doc_info in pending:
             doc_id = doc_info["doc_id"]
             folder_name = doc_info["folder_name"]
 
             try:
-                # Fetch the latest version from the API
-                docs = await self.granola.get_documents(limit=100, offset=0)
-                doc = next((d for d in docs if d.get("id") == doc_id), None)
+                doc = docs_by_id.get(doc_id)
 
                 if doc and self._has_content(doc):
                     if dry_run:
@@ -420,6 +621,86 @@ class SyncService:
 
         return result
 
+    def _delivery_groups(self, docs: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Split documents into the groups sent by one webhook request each.
+
+        Args:
+            docs: Documents ready to be sent
+
+        Returns:
+            Chunks of webhook.batch_size documents if batching is enabled,
+            otherwise one group per document
+        """
+        if not self.config.webhook.batch:
+            return [[doc] for doc in docs]
+        size = self.config.webhook.batch_size
+        return [docs[i : i + size] for i in range(0, len(docs), size)]
+
+    async def _deliver(self, docs: list[dict[str, Any]], folder_name: str) -> list[bool]:
+        """Send a delivery group, as one batch if batching is enabled.
+
+        Args:
+            docs: Documents from _delivery_groups()
+            folder_name: Name of the folder
+
+        Returns:
+            Whether each document was synced
+        """
+        if self.config.webhook.batch:
+            return await self._process_batch(docs, folder_name)
+        return [await self._process_document(doc, folder_name) for doc in docs]
+
+    async def _process_batch(self, docs: list[dict[str, Any]], folder_name: str) -> list[bool]:
+        """Process several documents: fetch details and send one batched webhook.
+
+        Args:
+            docs: Documents to process
+            folder_name: Name of the folder
+
+        Returns:
+            Whether each document was synced; the batch succeeds or fails as a whole
+        """
+        doc_ids = [doc["id"] for doc in docs]
+        logger.info("processing_batch", doc_ids=doc_ids, folder=folder_name)
+
+        try:
+            # Optionally fetch transcripts
+            transcripts: dict[str, Any] = {}
+            if self.config.granola.include_transcript:
+                transcripts = await self.granola.get_transcripts_bulk(doc_ids)
+                for doc_id, transcript in transcripts.items():
+                    if isinstance(transcript, BaseException):
+                        logger.warning(
+                            "transcript_fetch_failed",
+                            doc_id=doc_id,
+                            error=str(transcript),
+                        )
+
+            payloads = []
+            for doc in docs:
+                transcript = transcripts.get(doc["id"])
+                if isinstance(transcript, BaseException):
+                    transcript = None
+                payloads.append(self._build_payload(doc, folder_name, transcript))
+
+            await self.webhook.send_batch(payloads)
+
+        except Exception as e:
+            for doc in docs:
+                self.state.mark_failed(doc["id"], str(e), folder_name, doc)
+            logger.error(
+                "batch_failed",
+                doc_ids=doc_ids,
+                folder=folder_name,
+                error=str(e),
+            )
+            return [False] * len(docs)
+
+        for doc in docs:
+            self.state.mark_synced(doc["id"], doc, folder_name)
+        logger.info("batch_synced", doc_ids=doc_ids, folder=folder_name)
+        return [True] * len(docs)
+
     async def _process_document(self, doc: dict[str, Any], folder_name: str) -> bool:
         """Process a single document: fetch details and send webhook.
 
@@ -481,34 +762,69 @@ class SyncService:
     ) -> dict[str, Any]:
         """Build webhook payload from Granola document.
 
+        The transcript-independent part is cached per document version. The only
+        cache hit in practice is a failed document retried in a later cycle.
+
         Args:
             doc: The document data
             folder_name: The folder name
             transcript: Optional transcript segments
 
         Returns:
-            Webhook payload dict
+            Webhook payload dict, not shared with the cache
+        """
+        updated_at = doc.get("updated_at")
+        cached = self._payload_cache.get(doc["id"])
+        if cached is not None and cached[0] == updated_at and cached[1] == folder_name:
+            self._payload_cache.move_to_end(doc["id"])
+            base = cached[2]
+        else:
+            base = self._build_payload_base(doc, folder_name)
+            if updated_at is not None:
+                self._payload_cache[doc["id"]] = (updated_at, folder_name, base)
+                if len(self._payload_cache) > PAYLOAD_CACHE_SIZE:
+                    self._payload_cache.popitem(last=False)
+
+        # Format transcript
+        transcript_text = ""
+        if transcript:
+            # A list lets join size the result in one pass; the speaker prefix is
+            # a constant picked per segment rather than formatted into it
+            transcript_text = "\n".join(
+                [
+                    f"{'Me: ' if t.get('source') == 'microphone' else 'Them: '}{t.get('text', '')}"
+                    for t in transcript
+                ]
+            )
+
+        # Copy the one mutable value so callers can't alter the cached base
+        return {
+            **base,
+            "participants": list(base["participants"]),
+            "transcript": transcript_text,
+        }
+
+    def _build_payload_base(self, doc: dict[str, Any], folder_name: str) -> dict[str, Any]:
+        """Build the transcript-independent part of the webhook payload.
+
+        Args:
+            doc: The document data
+            folder_name: The folder name
+
+        Returns:
+            Webhook payload dict without the transcript
         """
         # Extract participants from people.attendees (new API structure)
         # or from attendees array (fallback)
-        participants = []
         people = doc.get("people", {})
-        if isinstance(people, dict):
-            # New API structure: people.attendees is an array of {name, email}
-            for attendee in people.get("attendees", []):
-                name = attendee.get("name") or attendee.get("email")
-                if name:
-                    participants.append(name)
-        elif isinstance(people, list):
-            # Legacy structure: people is an array
-            for person in people:
-                name = person.get("display_name") or person.get("name")
-                if name:
-                    participants.append(name)
+        extract = _PARTICIPANT_EXTRACTORS.get(type(people))
+        participants = extract(people) if extract else []
 
         # Also check top-level attendees array
+        seen = set(participants)
         for attendee in doc.get("attendees", []):
-            if isinstance(attendee, str) and attendee not in participants:
+            if isinstance(attendee, str) and attendee not in seen:
+                seen.add(attendee)
                 participants.append(attendee)
 
         # Extract note text: prefer pre-rendered markdown from cache,
@@ -525,14 +841,6 @@ class SyncService:
         else:
             note_text = doc.get("notes_plain", "")
 
-        # Format transcript
-        transcript_text = ""
-        if transcript:
-            transcript_text = "\n".join(
-                f"{'Me' if t.get('source') == 'microphone' else 'Them'}: {t.get('text', '')}"
-                for t in transcript
-            )
-
         return {
             "source": "Granola",
             "folder_name": folder_name,
@@ -541,14 +849,16 @@ class SyncService:
             "meeting_started_at": doc.get("created_at"),
             "participants": participants,
             "note_text": note_text,
-            "transcript": transcript_text,
-            "url": f"https://notes.granola.ai/d/{doc['id']}",
+            "transcript": "",
+            "url": GRANOLA_NOTE_URL_PREFIX + doc["id"],
         }
 
     def _prosemirror_to_text(self, content: dict[str, Any]) -> str:
         """Convert ProseMirror content to plain text.
 
         This is a simplified converter that extracts text from the content structure.
+        Nodes are walked depth-first with an explicit stack, so deeply nested
+        documents can't hit the recursion limit.
 
         Args:
             content: ProseMirror content dict
@@ -559,61 +869,59 @@ class SyncService:
         if not content:
             return ""
 
-        lines = []
-        self._extract_text(content, lines)
-        return "\n".join(lines)
-
-    def _extract_text(self, node: dict[str, Any], lines: list[str], prefix: str = "") -> None:
-        """Recursively extract text from ProseMirror node.
+        lines: list[str] = []
+        # (node, line prefix) pairs; children are pushed in reverse so they are
+        # popped in document order
+        stack: list[tuple[dict[str, Any], str]] = [(content, "")]
+        pop = stack.pop
+        push = stack.extend
+
+        while stack:
+            node, prefix = pop()
+            node_type = node.get("type")
+
+            if node_type == "text":
+                # Text node - continue the current line
+                text = node.get("text", "")
+                if lines and not lines[-1].endswith("\n"):
+                    lines[-1] += text
+                else:
+                    lines.append(prefix + text)
+                continue
 
-        Args:
-            node: ProseMirror node
-            lines: List to append lines to
-            prefix: Line prefix (for lists, etc.)
-        """
-        node_type = node.get("type", "")
+            children = node.get("content") or ()
 
-        if node_type == "text":
-            # Text node - return the text content
-            text = node.get("text", "")
-            if lines and not lines[-1].endswith("\n"):
-                lines[-1] += text
+            if node_type == "bulletList":
+                push((child, "- ") for child in reversed(children))
+            elif node_type == "orderedList":
+                push((children[i - 1], f"{i}. ") for i in range(len(children), 0, -1))
             else:
-                lines.append(prefix + text)
-            return
-
-        if node_type == "heading":
-            level = node.get("attrs", {}).get("level", 1)
-            prefix = "#" * level + " "
-
-        if node_type == "bulletList":
-            for child in node.get("content", []):
-                self._extract_text(child, lines, "- ")
-            return
+                if node_type == "heading":
+                    level = node.get("attrs", {}).get("level", 1)
+                    prefix = "#" * level + " "
+                    if lines:
+                        lines.append("")
+                elif node_type == "paragraph":
+                    # Start a new line for paragraphs
+                    if lines:
+                        lines.append("")
+                # Paragraph, heading and any other node: walk the content
+                push((child, prefix) for child in reversed(children))
 
-        if node_type == "orderedList":
-            for i, child in enumerate(node.get("content", []), 1):
-                self._extract_text(child, lines, f"{i}. ")
-            return
-
-        if node_type == "paragraph" or node_type == "heading":
-            # Start a new line for paragraphs
-            if lines:
-                lines.append("")
-            for child in node.get("content", []):
-                self._extract_text(child, lines, prefix)
-            return
-
-        # For other nodes, just recurse into content
-        for child in node.get("content", []):
-            self._extract_text(child, lines, prefix)
+        return "\n".join(lines)
 
     def stop(self) -> None:
-        """Stop the sync loop."""
-        self._running = False
+        """Stop the sync loop.
+
+        A loop waiting for its next cycle stops right away; a cycle in progress
+        is finished first.
+        """
+        self._stop_event.set()
         logger.info("sync_stopped")
 
     async def close(self) -> None:
         """Close all connections."""
         await self.granola.close()
         await self.webhook.close()
+        if self._http is not None:
+            await self._http.aclose()
@@ -1,17 +1,29 @@
 """Webhook sender with HMAC signing."""
 
+import asyncio
 import hashlib
 import hmac
 import json
+import random
 from typing import Any, Optional
 
 import httpx
 import structlog
 
 from . import __version__
+from .granola_api import create_http_client
 
 logger = structlog.get_logger()
 
+# Compact, ASCII-escaped JSON in insertion order: the encoding signatures are
+# computed over. Built once, as json.dumps() makes a new encoder for these options.
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _canonical_bytes(payload: dict[str, Any]) -> bytes:
+    """Serialize a payload the way it is signed."""
+    return _CANONICAL_ENCODER.encode(payload).encode("utf-8")
+
 
 def sign_payload(payload: dict[str, Any], secret: str) -> str:
     """Generate HMAC-SHA256 signature for webhook payload.
@@ -23,10 +35,9 @@ def sign_payload(payload: dict[str, Any], secret: str) -> str:
     Returns:
         Signature in the format "sha256=<hexdigest>"
     """
-    payload_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
     signature = hmac.new(
         secret.encode("utf-8"),
-        payload_bytes,
+        _canonical_bytes(payload),
         hashlib.sha256,
     ).hexdigest()
     return f"sha256={signature}"
@@ -43,8 +54,10 @@ def verify_signature(payload: dict[str, Any], secret: str, signature: str) -> bo
     Returns:
         True if the signature is valid, False otherwise
     """
-    expected = sign_payload(payload, secret)
-    return hmac.compare_digest(expected, signature)
+    # Compare the whole "sha256=<hex>" string, so only the exact lowercase
+    # form that sign_payload() produces is accepted
+    expected = sign_payload(payload, secret).encode("ascii")
+    return hmac.compare_digest(expected, signature.encode("utf-8", "replace"))
 
 
 class WebhookSender:
@@ -55,7 +68,9 @@ class WebhookSender:
         url: str,
         secret: str,
         retry_attempts: int = 3,
-        retry_delay: int = 30,
+        retry_delay: float = 30,
+        client: Optional[httpx.AsyncClient] = None,
+        max_retry_delay: float = 300,
     ):
         """Initialize the webhook sender.
 
@@ -63,23 +78,40 @@ class WebhookSender:
             url: The webhook endpoint URL
             secret: The HMAC signing secret
             retry_attempts: Number of retry attempts for failed requests
-            retry_delay: Delay in seconds between retries
+            retry_delay: Delay in seconds before the first retry, doubled for
+                each further retry and jittered
+            client: HTTP client to use instead of creating one. The caller owns
+                it and is responsible for closing it.
+            max_retry_delay: Upper bound in seconds on the delay before jitter
         """
         self.url = url
         self.secret = secret
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
-        self._client: Optional[httpx.AsyncClient] = None
+        self.max_retry_delay = max_retry_delay
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+        # Keyed HMAC state, copied per payload so the key is only processed once
+        self._hmac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        # Headers shared by every request; only the signature varies
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "User-Agent": f"granola-sync/{__version__}",
+        }
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
+        """Get or create the HTTP client.
+
+        An owned client is pooled and HTTP/2 capable like the shared API
+        client, so repeated sends reuse one connection to the endpoint.
+        """
+        if self._owns_client and (self._client is None or self._client.is_closed):
+            self._client = create_http_client()
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
+        """Close the HTTP client, unless it was given to the constructor."""
+        if self._owns_client and self._client and not self._client.is_closed:
             await self._client.aclose()
 
     async def send(self, payload: dict[str, Any]) -> httpx.Response:
@@ -91,76 +123,113 @@ class WebhookSender:
         Returns:
             The HTTP response
 
+        Raises:
+            httpx.HTTPStatusError: If the request fails after all retries
+        """
+        return await self._post_signed(payload, note_id=payload.get("note_id"))
+
+    async def send_batch(self, payloads: list[dict[str, Any]]) -> httpx.Response:
+        """Send several payloads in one signed webhook.
+
+        The body is ``{"source": "Granola", "events": [...]}``, with the
+        payloads in the same format as for send().
+
+        Args:
+            payloads: The payloads to send
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails after all retries
+        """
+        body = {"source": "Granola", "events": payloads}
+        return await self._post_signed(body, events=len(payloads))
+
+    def _retry_backoff(self, attempt: int) -> float:
+        """Get the delay before retrying after a failed attempt.
+
+        The delay doubles with each attempt up to max_retry_delay, then is
+        scaled by a random factor between 0.5 and 1.5 so that concurrent sends
+        failing together don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.retry_delay * 2**attempt, self.max_retry_delay)
+        return delay * (0.5 + random.random())
+
+    async def _post_signed(self, payload: dict[str, Any], **log_context: Any) -> httpx.Response:
+        """POST a signed payload, retrying server errors and rate limiting.
+
+        Args:
+            payload: The request body
+            **log_context: Extra fields for the log events
+
+        Returns:
+            The HTTP response
+
         Raises:
             httpx.HTTPStatusError: If the request fails after all retries
         """
         client = await self._get_client()
 
-        signature = sign_payload(payload, self.secret)
-        headers = {
-            "Content-Type": "application/json",
-            "X-Granola-Signature": signature,
-            "User-Agent": f"granola-sync/{__version__}",
-        }
+        # Serialize once: the exact bytes that are signed are sent on every attempt
+        body = _canonical_bytes(payload)
+        mac = self._hmac.copy()
+        mac.update(body)
+        headers = {**self._base_headers, "X-Granola-Signature": f"sha256={mac.hexdigest()}"}
 
+        # Context shared by every log event for this request, bound once
+        log = logger.bind(url=self.url, **log_context)
         last_error: Optional[Exception] = None
 
         for attempt in range(self.retry_attempts):
+            # Back off before every attempt but the first
+            if attempt:
+                await asyncio.sleep(self._retry_backoff(attempt - 1))
+
             try:
-                logger.debug(
-                    "sending_webhook",
-                    url=self.url,
-                    attempt=attempt + 1,
-                    note_id=payload.get("note_id"),
-                )
+                log.debug("sending_webhook", attempt=attempt + 1)
 
                 response = await client.post(
                     self.url,
-                    json=payload,
+                    content=body,
                     headers=headers,
                 )
                 response.raise_for_status()
 
-                logger.info(
-                    "webhook_sent",
-                    url=self.url,
-                    status=response.status_code,
-                    note_id=payload.get("note_id"),
-                )
+                log.info("webhook_sent", status=response.status_code)
                 return response
 
             except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                # Don't retry on client errors (4xx) except rate limiting
+                if 400 <= status < 500 and status != 429:
+                    log.error("webhook_failed", status=status)
+                    raise
+
                 last_error = e
-                logger.warning(
+                log.warning(
                     "webhook_failed",
-                    url=self.url,
-                    status=e.response.status_code,
+                    status=status,
                     attempt=attempt + 1,
                     max_attempts=self.retry_attempts,
-                    note_id=payload.get("note_id"),
                 )
 
-                # Don't retry on client errors (4xx) except rate limiting
-                if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
-                    raise
-
             except httpx.RequestError as e:
                 last_error = e
-                logger.warning(
+                log.warning(
                     "webhook_request_error",
-                    url=self.url,
                     error=str(e),
                     attempt=attempt + 1,
                     max_attempts=self.retry_attempts,
-                    note_id=payload.get("note_id"),
                 )
 
-            # Wait before retrying (unless this was the last attempt)
-            if attempt < self.retry_attempts - 1:
-                import asyncio
-                await asyncio.sleep(self.retry_delay)
-
-        # All retries exhausted
+        # All retries exhausted; there is no error only if retry_attempts < 1
         if last_error:
             raise last_error
         raise RuntimeError("Webhook send failed with unknown error")
@@ -1,12 +1,14 @@
 """Tests for CLI commands."""
 
 import json
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+from granola_sync import __version__
 from granola_sync.cli import app
 from granola_sync.config import (
     Config,
@@ -38,6 +40,18 @@ class TestVersion:
         assert result.exit_code == 0
         assert "granola-sync" in result.output
 
+    def test_entry_point_version_skips_cli(self, monkeypatch, capsys):
+        """Test the entry point answers --version without importing the CLI app."""
+        from granola_sync.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["granola-sync", "--version"])
+        monkeypatch.delitem(sys.modules, "granola_sync.cli")
+
+        main()
+
+        assert capsys.readouterr().out == f"granola-sync {__version__}\n"
+        assert "granola_sync.cli" not in sys.modules
+
 
 class TestConfigCommand:
     """Tests for config command."""
@@ -46,7 +60,7 @@ class TestConfigCommand:
         """Test config command creates config file."""
         config_path = tmp_path / ".granola-sync" / "config.yaml"
 
-        with patch("granola_sync.cli.get_default_config_path", return_value=config_path):
+        with patch("granola_sync.config.get_default_config_path", return_value=config_path):
             result = runner.invoke(
                 app,
                 ["config"],
@@ -61,7 +75,7 @@ class TestConfigCommand:
         """Test config command with --generate-secret."""
         config_path = tmp_path / ".granola-sync" / "config.yaml"
 
-        with patch("granola_sync.cli.get_default_config_path", return_value=config_path):
+        with patch("granola_sync.config.get_default_config_path", return_value=config_path):
             result = runner.invoke(
                 app,
                 ["config", "--generate-secret"],
@@ -95,7 +109,7 @@ class TestSyncOnceCommand:
         assert result.exit_code == 1
         assert "No configuration found" in result.output
 
-    @patch("granola_sync.cli.SyncService")
+    @patch("granola_sync.sync.SyncService")
     def test_sync_once_dry_run(self, mock_service_class: MagicMock, config_file: Path):
         """Test sync-once with --dry-run."""
         mock_service = MagicMock()
@@ -126,7 +140,7 @@ class TestSyncOnceCommand:
         assert "Dry run mode" in result.output
         mock_service.sync_once.assert_called_once_with(dry_run=True)
 
-    @patch("granola_sync.cli.SyncService")
+    @patch("granola_sync.sync.SyncService")
     def test_sync_once_with_folder_override(self, mock_service_class: MagicMock, config_file: Path):
         """Test sync-once with folder override."""
         mock_service = MagicMock()
@@ -232,8 +246,8 @@ class TestRunCommand:
         assert result.exit_code == 1
         assert "No configuration found" in result.output
 
-    @patch("granola_sync.cli.SyncService")
-    @patch("granola_sync.cli.asyncio.run")
+    @patch("granola_sync.sync.SyncService")
+    @patch("asyncio.run", side_effect=lambda coro: coro.close())
     def test_run_starts_service(
         self, mock_asyncio_run: MagicMock, mock_service_class: MagicMock, config_file: Path
     ):
@@ -247,8 +261,8 @@ class TestRunCommand:
         assert "Starting sync service" in result.output
         mock_asyncio_run.assert_called_once()
 
-    @patch("granola_sync.cli.SyncService")
-    @patch("granola_sync.cli.asyncio.run")
+    @patch("granola_sync.sync.SyncService")
+    @patch("asyncio.run", side_effect=lambda coro: coro.close())
     def test_run_with_overrides(
         self, mock_asyncio_run: MagicMock, mock_service_class: MagicMock, config_file: Path
     ):
@@ -274,3 +288,26 @@ class TestRunCommand:
         config_arg = call_args[0][0]
         assert config_arg.granola.folders == ["OTHER"]
         assert config_arg.sync.interval == 120
+
+
+class TestServiceCommands:
+    """Tests for start/stop commands."""
+
+    def test_stop_unsupported_platform(self):
+        """Test stop fails cleanly on platforms without a service manager."""
+        with patch("sys.platform", "win32"):
+            result = runner.invoke(app, ["stop"])
+
+        assert result.exit_code == 1
+        assert "Unsupported platform: win32" in result.output
+
+    def test_stop_dispatches_to_systemd_on_linux(self):
+        """Test stop uses systemd on Linux."""
+        with (
+            patch("sys.platform", "linux"),
+            patch("granola_sync.cli._stop_systemd") as mock_stop,
+        ):
+            result = runner.invoke(app, ["stop"])
+
+        assert result.exit_code == 0
+        mock_stop.assert_called_once()
@@ -1,25 +1,43 @@
 """Tests for Granola API client."""
 
+import asyncio
 import json
+import os
+import sys
 import time
 from pathlib import Path
 from unittest.mock import patch
 
 import httpx
+import orjson
 import pytest
 import respx
 
+from granola_sync import granola_api
+from granola_sync.config import SyncConfig
 from granola_sync.granola_api import (
     CACHE_FILENAMES,
+    GRANOLA_API_BASE,
+    KEEPALIVE_EXPIRY_SECONDS,
     GranolaCacheReader,
     GranolaClient,
     _get_granola_app_dir,
+    clear_token_cache,
+    close_shared_client,
+    create_http_client,
     get_granola_token,
+    get_ssl_context,
     get_token_file_path,
     is_token_expired,
     refresh_access_token,
 )
 
+# Mocked endpoints, shared by every test that routes them
+DOCUMENTS_URL = f"{GRANOLA_API_BASE}/v2/get-documents"
+DOCUMENT_LISTS_URL = f"{GRANOLA_API_BASE}/v2/get-document-lists"
+TRANSCRIPT_URL = f"{GRANOLA_API_BASE}/v1/get-document-transcript"
+REFRESH_TOKEN_URL = f"{GRANOLA_API_BASE}/v1/refresh-access-token"
+
 
 def create_workos_tokens(
     access_token: str = "test-token-123",
@@ -28,7 +46,7 @@ def create_workos_tokens(
 ) -> dict:
     """Helper to create a valid workos_tokens structure."""
     if obtained_at is None:
-        obtained_at = int(time.time() * 1000)
+        obtained_at = time.time_ns() // 1_000_000
     return {
         "access_token": access_token,
         "expires_in": expires_in,
@@ -45,59 +63,87 @@ def create_supabase_json(workos_tokens: dict) -> str:
     return json.dumps({"workos_tokens": json.dumps(workos_tokens)})
 
 
+@pytest.fixture(autouse=True)
+async def reset_granola_caches(monkeypatch: pytest.MonkeyPatch):
+    """Clear the memoized paths, cached credentials and shared client around each test."""
+    _get_granola_app_dir.cache_clear()
+    get_token_file_path.cache_clear()
+    clear_token_cache()
+    # Each test runs on its own event loop, so don't carry a client over
+    monkeypatch.setattr(granola_api, "_shared_client", None)
+    yield
+    await close_shared_client()
+    _get_granola_app_dir.cache_clear()
+    get_token_file_path.cache_clear()
+    clear_token_cache()
+
+
 class TestGetGranolaToken:
     """Tests for get_granola_token function."""
 
-    def test_get_token_from_file(self, tmp_path: Path):
+    @pytest.fixture
+    def token_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the app directory at a macOS layout under tmp_path."""
+        monkeypatch.setattr(granola_api.Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(sys, "platform", "darwin")
+        token_dir = tmp_path / "Library" / "Application Support" / "Granola"
+        token_dir.mkdir(parents=True)
+        return token_dir / "supabase.json"
+
+    def test_get_token_from_file(self, token_file: Path):
         """Test loading token from supabase.json file."""
-        with patch("granola_sync.granola_api.Path.home", return_value=tmp_path):
-            # Simulate macOS path
-            token_dir = tmp_path / "Library" / "Application Support" / "Granola"
-            token_dir.mkdir(parents=True)
-            token_file = token_dir / "supabase.json"
-            workos_tokens = create_workos_tokens(access_token="test-token-123")
-            token_file.write_text(create_supabase_json(workos_tokens))
+        workos_tokens = create_workos_tokens(access_token="test-token-123")
+        token_file.write_text(create_supabase_json(workos_tokens))
+
+        assert get_granola_token() == "test-token-123"
 
-            with patch("os.uname") as mock_uname:
-                mock_uname.return_value.sysname = "Darwin"
-                token = get_granola_token()
+    def test_get_token_from_nested_file(self, token_file: Path):
+        """Test loading workos_tokens stored as an object rather than a string."""
+        workos_tokens = create_workos_tokens(access_token="nested-token")
+        token_file.write_text(json.dumps({"workos_tokens": workos_tokens}))
 
-            assert token == "test-token-123"
+        assert get_granola_token() == "nested-token"
 
-    def test_get_token_file_not_found(self, tmp_path: Path):
+    def test_get_token_file_not_found(self, token_file: Path):
         """Test error when token file doesn't exist."""
-        with patch("granola_sync.granola_api.Path.home", return_value=tmp_path):
-            with patch("os.uname") as mock_uname:
-                mock_uname.return_value.sysname = "Darwin"
-                with pytest.raises(FileNotFoundError, match="Granola credentials not found"):
-                    get_granola_token()
+        with pytest.raises(FileNotFoundError, match="Granola credentials not found"):
+            get_granola_token()
 
-    def test_get_token_missing_workos_tokens(self, tmp_path: Path):
+    def test_get_token_missing_workos_tokens(self, token_file: Path):
         """Test error when workos_tokens key is missing from file."""
-        with patch("granola_sync.granola_api.Path.home", return_value=tmp_path):
-            token_dir = tmp_path / "Library" / "Application Support" / "Granola"
-            token_dir.mkdir(parents=True)
-            token_file = token_dir / "supabase.json"
-            token_file.write_text(json.dumps({"other_key": "value"}))
-
-            with patch("os.uname") as mock_uname:
-                mock_uname.return_value.sysname = "Darwin"
-                with pytest.raises(ValueError, match="Could not find workos_tokens"):
-                    get_granola_token()
-
-    def test_get_token_missing_access_token(self, tmp_path: Path):
+        token_file.write_text(json.dumps({"other_key": "value"}))
+
+        with pytest.raises(ValueError, match="Could not find workos_tokens"):
+            get_granola_token()
+
+    def test_get_token_missing_access_token(self, token_file: Path):
         """Test error when access_token is missing from workos_tokens."""
-        with patch("granola_sync.granola_api.Path.home", return_value=tmp_path):
-            token_dir = tmp_path / "Library" / "Application Support" / "Granola"
-            token_dir.mkdir(parents=True)
-            token_file = token_dir / "supabase.json"
-            workos_tokens = {"refresh_token": "refresh-only", "expires_in": 3600}
-            token_file.write_text(json.dumps({"workos_tokens": json.dumps(workos_tokens)}))
+        workos_tokens = {"refresh_token": "refresh-only", "expires_in": 3600}
+        token_file.write_text(json.dumps({"workos_tokens": json.dumps(workos_tokens)}))
+
+        with pytest.raises(ValueError, match="Could not find access_token"):
+            get_granola_token()
+
+    def test_get_token_cached_while_file_unchanged(self, token_file: Path):
+        """Test that a valid token is served from memory until supabase.json changes."""
+        token_file.write_text(create_supabase_json(create_workos_tokens(access_token="cached")))
+        original = token_file.stat()
+
+        assert get_granola_token() == "cached"
+
+        # Same mtime: the file isn't parsed again
+        token_file.write_text("not json")
+        os.utime(token_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+        assert get_granola_token() == "cached"
 
-            with patch("os.uname") as mock_uname:
-                mock_uname.return_value.sysname = "Darwin"
-                with pytest.raises(ValueError, match="Could not find access_token"):
-                    get_granola_token()
+        # New mtime: the new credentials are picked up
+        token_file.write_text(create_supabase_json(create_workos_tokens(access_token="new")))
+        os.utime(token_file, ns=(original.st_atime_ns, original.st_mtime_ns + 1))
+        assert get_granola_token() == "new"
+
+        token_file.unlink()
+        with pytest.raises(FileNotFoundError):
+            get_granola_token()
 
 
 class TestIsTokenExpired:
@@ -107,7 +153,7 @@ class TestIsTokenExpired:
         """Test that a fresh token is not expired."""
         workos_tokens = create_workos_tokens(
             expires_in=3600,
-            obtained_at=int(time.time() * 1000),
+            obtained_at=time.time_ns() // 1_000_000,
         )
         assert not is_token_expired(workos_tokens)
 
@@ -116,7 +162,7 @@ class TestIsTokenExpired:
         # Token obtained 2 hours ago with 1 hour expiry
         workos_tokens = create_workos_tokens(
             expires_in=3600,
-            obtained_at=int((time.time() - 7200) * 1000),
+            obtained_at=time.time_ns() // 1_000_000 - 7_200_000,
         )
         assert is_token_expired(workos_tokens)
 
@@ -125,7 +171,7 @@ class TestIsTokenExpired:
         # Token will expire in 4 minutes (within 5-minute buffer)
         workos_tokens = create_workos_tokens(
             expires_in=240,  # 4 minutes
-            obtained_at=int(time.time() * 1000),
+            obtained_at=time.time_ns() // 1_000_000,
         )
         assert is_token_expired(workos_tokens)
 
@@ -138,7 +184,7 @@ class TestRefreshAccessToken:
         """Test successful token refresh."""
         workos_tokens = create_workos_tokens(access_token="old-token")
 
-        respx.post("https://api.granola.ai/v1/refresh-access-token").mock(
+        respx.post(REFRESH_TOKEN_URL).mock(
             return_value=httpx.Response(
                 200,
                 json={
@@ -161,7 +207,7 @@ class TestRefreshAccessToken:
         """Test handling of refresh token failure."""
         workos_tokens = create_workos_tokens()
 
-        respx.post("https://api.granola.ai/v1/refresh-access-token").mock(
+        respx.post(REFRESH_TOKEN_URL).mock(
             return_value=httpx.Response(401, json={"error": "Invalid refresh token"})
         )
 
@@ -291,7 +337,7 @@ class TestGranolaCacheReader:
     @pytest.mark.asyncio
     async def test_get_folders_both_fail(self, cache_dir: Path):
         """GranolaClient.get_folders raises RuntimeError when cache and API both fail."""
-        respx.get("https://api.granola.ai/v2/get-document-lists").mock(
+        respx.get(DOCUMENT_LISTS_URL).mock(
             return_value=httpx.Response(500, json={"error": "Internal Server Error"})
         )
 
@@ -341,6 +387,36 @@ class TestGranolaCacheReaderFolderMap:
 
         assert folder_map == {"SQP": "f1", "CLIENT-A": "f2"}
 
+    def test_get_documents_for_folder(self, cache_dir: Path):
+        """Test folder documents are looked up by title."""
+        state = _make_cache_state(folder_title="Sales Calls")
+        state["documentListsMetadata"]["folder2"] = {"id": "folder2", "title": "Sales Calls"}
+        state["documentLists"]["folder2"] = ["missing"]
+        _write_v4_cache(cache_dir, state)
+
+        reader = GranolaCacheReader()
+        with patch("granola_sync.granola_api._get_granola_app_dir", return_value=cache_dir):
+            documents = reader.get_documents_for_folder("Sales Calls")
+            unknown = reader.get_documents_for_folder("Other")
+
+        assert [doc["id"] for doc in documents] == ["doc1"]
+        assert unknown == []
+
+    def test_cache_parsed_once_per_reader(self, cache_dir: Path):
+        """Test a reader parses the cache file once and reuses it."""
+        _write_v4_cache(cache_dir, _make_cache_state(folder_title="Sales Calls"))
+
+        reader = GranolaCacheReader()
+        with (
+            patch("granola_sync.granola_api._get_granola_app_dir", return_value=cache_dir),
+            patch("granola_sync.granola_api.orjson.loads", wraps=orjson.loads) as loads,
+        ):
+            reader.get_folder_map()
+            reader.get_documents_for_folder("Sales Calls")
+            reader.get_folders()
+
+        assert loads.call_count == 1
+
 
 class TestGranolaClient:
     """Tests for GranolaClient class."""
@@ -359,7 +435,7 @@ class TestGranolaClient:
             {"id": "folder2", "title": "Standups", "documents": [{"id": "doc1"}]},
         ]
 
-        respx.get("https://api.granola.ai/v2/get-document-lists").mock(
+        respx.get(DOCUMENT_LISTS_URL).mock(
             return_value=httpx.Response(200, json={"lists": mock_folders})
         )
 
@@ -384,7 +460,7 @@ class TestGranolaClient:
             {"id": "doc2", "title": "Meeting 2", "created_at": "2026-01-17T11:00:00Z"},
         ]
 
-        respx.post("https://api.granola.ai/v2/get-documents").mock(
+        respx.post(DOCUMENTS_URL).mock(
             return_value=httpx.Response(200, json={"docs": mock_documents})
         )
 
@@ -395,25 +471,47 @@ class TestGranolaClient:
 
         await client.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_documents_revalidates_with_etag(self, client):
+        """Test that an unchanged page is served from the last response on 304."""
+        mock_documents = [{"id": "doc1", "title": "Meeting 1"}]
+
+        route = respx.post(DOCUMENTS_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"docs": mock_documents}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        first = await client.get_documents(limit=100)
+        second = await client.get_documents(limit=100)
+
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert first == second == mock_documents
+
+        await client.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_get_all_documents(self, client):
         """Test fetching all documents with pagination."""
-        page1 = [
-            {"id": "doc1", "title": "Meeting 1"},
-            {"id": "doc2", "title": "Meeting 2"},
-        ]
-        page2 = [
-            {"id": "doc3", "title": "Meeting 3"},
-        ]
+        pages = {
+            0: [
+                {"id": "doc1", "title": "Meeting 1"},
+                {"id": "doc2", "title": "Meeting 2"},
+            ],
+            2: [
+                {"id": "doc3", "title": "Meeting 3"},
+            ],
+        }
 
-        # Mock two pages of results
-        route = respx.post("https://api.granola.ai/v2/get-documents")
-        route.side_effect = [
-            httpx.Response(200, json={"docs": page1}),
-            httpx.Response(200, json={"docs": page2}),
-            httpx.Response(200, json={"docs": []}),
-        ]
+        def respond(request: httpx.Request) -> httpx.Response:
+            offset = json.loads(request.content)["offset"]
+            return httpx.Response(200, json={"docs": pages.get(offset, [])})
+
+        respx.post(DOCUMENTS_URL).mock(side_effect=respond)
 
         documents = await client.get_all_documents(page_size=2)
 
@@ -423,6 +521,27 @@ class TestGranolaClient:
 
         await client.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_all_documents_prefetches_pages(self, client):
+        """Test that pages are requested concurrently and kept in order."""
+        all_docs = [{"id": f"doc{i}"} for i in range(7)]
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            page = all_docs[body["offset"] : body["offset"] + body["limit"]]
+            return httpx.Response(200, json={"docs": page})
+
+        route = respx.post(DOCUMENTS_URL).mock(side_effect=respond)
+
+        documents = await client.get_all_documents(page_size=2, concurrency=2)
+
+        assert [d["id"] for d in documents] == [d["id"] for d in all_docs]
+        # First page, then two batches of two pages
+        assert route.call_count == 5
+
+        await client.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_get_transcript(self, client):
@@ -432,7 +551,7 @@ class TestGranolaClient:
             {"source": "speaker", "text": "Hi there"},
         ]
 
-        respx.post("https://api.granola.ai/v1/get-document-transcript").mock(
+        respx.post(TRANSCRIPT_URL).mock(
             return_value=httpx.Response(200, json=mock_transcript)
         )
 
@@ -443,11 +562,49 @@ class TestGranolaClient:
 
         await client.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_transcript_error(self, client):
+        """Test a failed transcript request raises."""
+        respx.post(TRANSCRIPT_URL).mock(
+            return_value=httpx.Response(404, json={"error": "Not found"})
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_transcript("doc1")
+
+        await client.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_transcripts_bulk(self, client):
+        """Test fetching several transcripts keyed by document ID."""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            doc_id = json.loads(request.content)["document_id"]
+            if doc_id == "doc2":
+                return httpx.Response(500)
+            return httpx.Response(200, json=[{"source": "microphone", "text": doc_id}])
+
+        route = respx.post(TRANSCRIPT_URL).mock(
+            side_effect=respond
+        )
+
+        transcripts = await client.get_transcripts_bulk(["doc1", "doc2", "doc3"], concurrency=2)
+
+        assert route.call_count == 3
+        assert list(transcripts) == ["doc1", "doc2", "doc3"]
+        assert transcripts["doc1"][0]["text"] == "doc1"
+        assert isinstance(transcripts["doc2"], httpx.HTTPStatusError)
+        assert transcripts["doc3"][0]["text"] == "doc3"
+
+        await client.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_api_error_handling(self, client):
         """Test handling of API errors."""
-        respx.post("https://api.granola.ai/v2/get-documents").mock(
+        respx.post(DOCUMENTS_URL).mock(
             return_value=httpx.Response(401, json={"error": "Unauthorized"})
         )
 
@@ -464,7 +621,7 @@ class TestGranolaClient:
             {"id": "doc1", "title": "Meeting in Folder", "created_at": "2026-01-17T10:00:00Z"},
         ]
 
-        route = respx.post("https://api.granola.ai/v2/get-documents")
+        route = respx.post(DOCUMENTS_URL)
         route.mock(return_value=httpx.Response(200, json={"docs": mock_docs}))
 
         documents = await client.get_documents_by_folder("folder-123", limit=50)
@@ -480,11 +637,26 @@ class TestGranolaClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_clients_share_ssl_context(self):
+        """Test the CA bundle is loaded once for all created clients."""
+        get_ssl_context.cache_clear()
+        with patch(
+            "granola_sync.granola_api.httpx.create_ssl_context",
+            wraps=httpx.create_ssl_context,
+        ) as create_ssl_context:
+            first = create_http_client()
+            second = create_http_client()
+
+        assert create_ssl_context.call_count == 1
+        await first.aclose()
+        await second.aclose()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_client_reuses_connection(self, client):
         """Test that the client reuses the HTTP connection."""
-        respx.post("https://api.granola.ai/v2/get-documents").mock(
+        respx.post(DOCUMENTS_URL).mock(
             return_value=httpx.Response(200, json={"docs": []})
         )
 
@@ -497,4 +669,256 @@ class TestGranolaClient:
         assert not client._client.is_closed
 
         await client.close()
-        assert client._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_uses_http2(self, client):
+        """Test that the client's pool negotiates HTTP/2 where the server offers it."""
+        with patch(
+            "granola_sync.granola_api.httpx.AsyncHTTPTransport",
+            wraps=httpx.AsyncHTTPTransport,
+        ) as transport:
+            await client._get_client()
+
+        assert transport.call_args.kwargs["http2"] is True
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_client_pool_outlives_poll_interval(self, client):
+        """Test that pooled connections are kept alive longer than a poll interval."""
+        http_client = await client._get_client()
+        pool = http_client._transport._pool
+
+        assert pool._keepalive_expiry == KEEPALIVE_EXPIRY_SECONDS
+        assert KEEPALIVE_EXPIRY_SECONDS > SyncConfig().interval
+        assert await client._get_client() is http_client
+
+        await client.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_clients_share_connection_pool(self):
+        """Test that clients share one HTTP client but send their own token."""
+        route = respx.post(DOCUMENTS_URL).mock(
+            return_value=httpx.Response(200, json={"docs": []})
+        )
+        first = GranolaClient(token="token-a")
+        second = GranolaClient(token="token-b")
+
+        await first.get_documents()
+        await second.get_documents()
+
+        assert first._client is second._client
+        assert [call.request.headers["Authorization"] for call in route.calls] == [
+            "Bearer token-a",
+            "Bearer token-b",
+        ]
+
+        await first.close()
+        await second.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(self):
+        """Test closing one client doesn't close the pool other clients are using."""
+        respx.post(DOCUMENTS_URL).mock(
+            return_value=httpx.Response(200, json={"docs": []})
+        )
+        first = GranolaClient(token="token-a")
+        second = GranolaClient(token="token-b")
+        await first.get_documents()
+        shared = await second._get_client()
+
+        await first.close()
+
+        assert not shared.is_closed
+        await second.get_documents()
+        assert second._client is shared
+        await second.close()
+
+        await close_shared_client()
+        assert shared.is_closed
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_refresh_token_once(self, tmp_path: Path):
+        """Test that concurrent requests with an expired token trigger a single refresh."""
+        expired = create_workos_tokens(
+            access_token="expired-token",
+            expires_in=3600,
+            obtained_at=time.time_ns() // 1_000_000 - 7_200_000,
+        )
+        token_dir = tmp_path / "Library" / "Application Support" / "Granola"
+        token_dir.mkdir(parents=True)
+        (token_dir / "supabase.json").write_text(create_supabase_json(expired))
+
+        refresh_route = respx.post(REFRESH_TOKEN_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={"access_token": "fresh-token", "expires_in": 3600, "token_type": "Bearer"},
+            )
+        )
+        docs_route = respx.post(DOCUMENTS_URL).mock(
+            return_value=httpx.Response(200, json={"docs": []})
+        )
+
+        client = GranolaClient()
+        with (
+            patch("granola_sync.granola_api.Path.home", return_value=tmp_path),
+            patch("sys.platform", "darwin"),
+        ):
+            await asyncio.gather(*(client.get_documents() for _ in range(5)))
+
+        assert refresh_route.call_count == 1
+        assert docs_route.call_count == 5
+        assert {c.request.headers["Authorization"] for c in docs_route.calls} == {
+            "Bearer fresh-token"
+        }
+
+        await client.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_refresh_uses_injected_client(self, tmp_path: Path):
+        """Test a token refresh goes through the client given to the constructor."""
+        expired = create_workos_tokens(
+            access_token="expired-token",
+            expires_in=3600,
+            obtained_at=time.time_ns() // 1_000_000 - 7_200_000,
+        )
+        token_dir = tmp_path / "Library" / "Application Support" / "Granola"
+        token_dir.mkdir(parents=True)
+        (token_dir / "supabase.json").write_text(create_supabase_json(expired))
+
+        refresh_route = respx.post(REFRESH_TOKEN_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={"access_token": "fresh-token", "expires_in": 3600, "token_type": "Bearer"},
+            )
+        )
+        respx.post(DOCUMENTS_URL).mock(return_value=httpx.Response(200, json={"docs": []}))
+
+        http_client = create_http_client()
+        client = GranolaClient(client=http_client)
+        with (
+            patch("granola_sync.granola_api.Path.home", return_value=tmp_path),
+            patch("sys.platform", "darwin"),
+            patch.object(http_client, "post", wraps=http_client.post) as post,
+        ):
+            await client.get_documents()
+
+        assert refresh_route.call_count == 1
+        assert post.call_count == 2  # The refresh and the documents request
+        assert granola_api._shared_client is None
+
+        await client.close()
+        await http_client.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_token_refreshed_after_deadline(self, tmp_path: Path):
+        """Test that a loaded token is refreshed once its refresh deadline passes."""
+        tokens = create_workos_tokens(access_token="loaded-token", expires_in=3600)
+        token_dir = tmp_path / "Library" / "Application Support" / "Granola"
+        token_dir.mkdir(parents=True)
+        (token_dir / "supabase.json").write_text(create_supabase_json(tokens))
+
+        refresh_route = respx.post(REFRESH_TOKEN_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={"access_token": "fresh-token", "expires_in": 3600, "token_type": "Bearer"},
+            )
+        )
+        docs_route = respx.post(DOCUMENTS_URL).mock(
+            return_value=httpx.Response(200, json={"docs": []})
+        )
+
+        client = GranolaClient()
+        with (
+            patch("granola_sync.granola_api.Path.home", return_value=tmp_path),
+            patch("sys.platform", "darwin"),
+        ):
+            await client.get_documents()
+            later = time.time_ns() + 3600 * 1_000_000_000
+            with patch("granola_sync.granola_api.time.time_ns", return_value=later):
+                await client.get_documents()
+
+        assert refresh_route.call_count == 1
+        assert [c.request.headers["Authorization"] for c in docs_route.calls] == [
+            "Bearer loaded-token",
+            "Bearer fresh-token",
+        ]
+
+        await client.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_token_file_rotated_between_requests(self, tmp_path: Path):
+        """Test tokens rewritten by the Granola app are picked up by a running client."""
+        token_file = tmp_path / "Library" / "Application Support" / "Granola" / "supabase.json"
+        token_file.parent.mkdir(parents=True)
+        token_file.write_text(create_supabase_json(create_workos_tokens("first-token")))
+
+        refresh_route = respx.post(REFRESH_TOKEN_URL).mock(return_value=httpx.Response(401))
+        docs_route = respx.post(DOCUMENTS_URL).mock(
+            return_value=httpx.Response(200, json={"docs": []})
+        )
+
+        client = GranolaClient()
+        with (
+            patch("granola_sync.granola_api.Path.home", return_value=tmp_path),
+            patch("sys.platform", "darwin"),
+        ):
+            await client.get_documents()
+
+            # An hour later the first token has expired and the app has rotated it
+            later = time.time_ns() + 3600 * 1_000_000_000
+            mtime = token_file.stat().st_mtime_ns
+            token_file.write_text(create_supabase_json(
+                create_workos_tokens("rotated-token", obtained_at=later // 1_000_000)
+            ))
+            os.utime(token_file, ns=(mtime, mtime + 1_000_000_000))
+            with patch("granola_sync.granola_api.time.time_ns", return_value=later):
+                await client.get_documents()
+
+        assert refresh_route.call_count == 0
+        assert [c.request.headers["Authorization"] for c in docs_route.calls] == [
+            "Bearer first-token",
+            "Bearer rotated-token",
+        ]
+
+        await client.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_token_file_reread_when_refresh_fails(self, tmp_path: Path):
+        """Test a failed refresh re-reads supabase.json before giving up."""
+        token_file = tmp_path / "Library" / "Application Support" / "Granola" / "supabase.json"
+        token_file.parent.mkdir(parents=True)
+        token_file.write_text(create_supabase_json(create_workos_tokens(
+            access_token="revoked-token",
+            obtained_at=time.time_ns() // 1_000_000 - 7_200_000,
+        )))
+
+        def rotate_then_reject(request: httpx.Request) -> httpx.Response:
+            # The app rotated the tokens while the refresh was in flight
+            mtime = token_file.stat().st_mtime_ns
+            token_file.write_text(create_supabase_json(create_workos_tokens("rotated-token")))
+            os.utime(token_file, ns=(mtime, mtime + 1_000_000_000))
+            return httpx.Response(401)
+
+        respx.post(REFRESH_TOKEN_URL).mock(side_effect=rotate_then_reject)
+        docs_route = respx.post(DOCUMENTS_URL).mock(
+            return_value=httpx.Response(200, json={"docs": []})
+        )
+
+        client = GranolaClient()
+        with (
+            patch("granola_sync.granola_api.Path.home", return_value=tmp_path),
+            patch("sys.platform", "darwin"),
+        ):
+            await client.get_documents()
+
+        assert docs_route.calls.last.request.headers["Authorization"] == "Bearer rotated-token"
+
+        await client.close()
@@ -1,7 +1,9 @@
 """Tests for state manager."""
 
 import json
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -190,6 +192,16 @@ class TestStateManager:
 
         assert seen == {"doc1", "doc2"}
 
+    def test_seen_document_ids_is_a_copy(self, manager: StateManager):
+        """Test that changing the returned set doesn't affect the state."""
+        manager.mark_synced("doc1", {"title": "Test 1"}, "SQP")
+
+        seen = manager.get_seen_document_ids()
+        seen.add("doc2")
+
+        assert manager.get_seen_document_ids() == {"doc1"}
+        assert manager.is_document_seen("doc2") is False
+
     def test_clear(self, manager: StateManager):
         """Test clearing state."""
         manager.mark_synced("doc1", {"title": "Test"}, "SQP")
@@ -224,6 +236,11 @@ class TestStateManager:
         assert manager._state["version"] == 2
         assert manager._state["seen_documents"] == {}
 
+        # The unreadable file is kept aside rather than overwritten by the next save
+        corrupt_files = list(state_file.parent.glob("state.json.corrupt.*"))
+        assert [f.read_text() for f in corrupt_files] == ["not valid json {{{"]
+        assert not state_file.exists()
+
     def test_migrate_v1_to_v2(self, state_file: Path):
         """Test that v1 state is migrated to v2 with new fields."""
         v1_state = {
@@ -281,3 +298,62 @@ class TestStateManager:
         manager.clear_pending("doc1")
         assert manager.is_document_pending("doc1") is False
         assert manager.get_pending_documents() == []
+
+    def test_save_replaces_file_atomically(self, manager: StateManager, state_file: Path):
+        """Test that save leaves no temporary file behind."""
+        manager.mark_synced("doc1", {"title": "Test"}, "SQP")
+        manager.save()
+
+        assert [p.name for p in state_file.parent.iterdir()] == ["state.json"]
+        assert json.loads(state_file.read_text())["seen_documents"]["doc1"]["title"] == "Test"
+
+    @pytest.mark.asyncio
+    async def test_aflush_only_writes_changes(self, state_file: Path):
+        """Test that aflush skips the write when nothing has changed."""
+        manager = StateManager(str(state_file))
+        assert await manager.aflush() is True
+
+        reloaded = StateManager(str(state_file))
+        assert await reloaded.aflush() is False
+
+        reloaded.update_folder_map({})
+        assert await reloaded.aflush() is False
+
+        reloaded.mark_synced("doc1", {"title": "Test"}, "SQP")
+        assert await reloaded.aflush() is True
+        assert await reloaded.aflush() is False
+
+    @pytest.mark.asyncio
+    async def test_asave_writes_off_the_event_loop(self, state_file: Path):
+        """Test that asave writes the file from a worker thread."""
+        manager = StateManager(str(state_file))
+        manager.mark_synced("doc1", {"title": "Test"}, "SQP")
+        loop_thread = threading.get_ident()
+        write_threads = []
+        write_bytes = Path.write_bytes
+
+        def record_write(path: Path, data: bytes) -> int:
+            write_threads.append(threading.get_ident())
+            return write_bytes(path, data)
+
+        with patch.object(Path, "write_bytes", autospec=True, side_effect=record_write):
+            assert await manager.aflush() is True
+            assert await manager.aflush() is False
+
+        assert len(write_threads) == 1
+        assert write_threads[0] != loop_thread
+        assert StateManager(str(state_file)).is_document_seen("doc1")
+
+    def test_indexes_follow_loaded_and_cleared_state(self, state_file: Path):
+        """Test that seen/updated lookups reflect the loaded file and clear()."""
+        manager1 = StateManager(str(state_file))
+        manager1.mark_synced("doc1", {"title": "Test", "updated_at": "2026-01-17T10:00:00Z"}, "SQP")
+        manager1.save()
+
+        manager2 = StateManager(str(state_file))
+        assert manager2.is_document_updated("doc1", "2026-01-17T10:00:00Z") is False
+        assert manager2.is_document_updated("doc1", "2026-01-18T10:00:00Z") is True
+
+        manager2.clear()
+        assert manager2.is_document_seen("doc1") is False
+        assert manager2.get_seen_document_ids() == set()
@@ -1,5 +1,6 @@
 """Tests for sync service."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -35,6 +36,7 @@ def mock_granola() -> MagicMock:
     mock.get_documents_by_folder = AsyncMock(return_value=[])
     mock.get_document = AsyncMock()
     mock.get_transcript = AsyncMock()
+    mock.get_transcripts_bulk = AsyncMock(return_value={})
     mock.close = AsyncMock()
     return mock
 
@@ -44,6 +46,7 @@ def mock_webhook() -> MagicMock:
     """Create a mock webhook sender."""
     mock = MagicMock()
     mock.send = AsyncMock(return_value=MagicMock(status_code=200))
+    mock.send_batch = AsyncMock(return_value=MagicMock(status_code=200))
     mock.close = AsyncMock()
     return mock
 
@@ -143,7 +146,11 @@ class TestSyncService:
         )
         service.config = Config(
             webhook=config.webhook,
-            granola=GranolaConfig(folders=["SQP"], folder_ids={"SQP": "sqp-folder-id"}),
+            granola=GranolaConfig(
+                folders=["SQP"],
+                folder_ids={"SQP": "sqp-folder-id"},
+                include_transcript=True,
+            ),
             sync=config.sync,
             state=config.state,
         )
@@ -152,6 +159,8 @@ class TestSyncService:
         assert summary["documents_found"] == 1
         assert summary["documents_new"] == 0
         mock_webhook.send.assert_not_called()
+        mock_granola.get_transcript.assert_not_called()
+        mock_granola.get_transcripts_bulk.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_sync_once_updated_document(
@@ -225,6 +234,8 @@ class TestSyncService:
         assert summary["documents_synced"] == 1
         assert summary["by_folder"]["SQP"]["documents"][0]["action"] == "would_sync"
         mock_webhook.send.assert_not_called()
+        mock_granola.get_transcript.assert_not_called()
+        mock_granola.get_transcripts_bulk.assert_not_called()
 
         # State should not be updated in dry run
         assert not state_manager.is_document_seen("doc1")
@@ -281,6 +292,278 @@ class TestSyncService:
         assert summary["documents_synced"] == 5  # Limited by batch_size
         assert mock_webhook.send.call_count == 5
 
+    @pytest.mark.asyncio
+    async def test_sync_once_writes_state_once(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test a cycle keeps state in memory and writes the file once at the end."""
+        docs = [_make_doc(f"doc{i}", f"Meeting {i}", f"Notes {i}") for i in range(10)]
+        mock_granola.get_documents_by_folder.return_value = docs
+        mock_granola.get_transcript.return_value = []
+        config.sync.batch_size = 10
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        with patch.object(state_manager, "_write", wraps=state_manager._write) as write:
+            summary = await service.sync_once()
+
+        assert summary["documents_synced"] == 10
+        write.assert_called_once()
+        assert len(StateManager(config.state.file).get_seen_document_ids()) == 10
+
+    @pytest.mark.asyncio
+    async def test_sync_once_processes_documents_concurrently(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test documents are sent concurrently, bounded by sync.concurrency."""
+        docs = [_make_doc(f"doc{i}", f"Meeting {i}", f"Notes {i}") for i in range(5)]
+        docs.insert(2, _make_doc("empty", "No notes yet", notes_markdown=""))
+        mock_granola.get_documents_by_folder.return_value = docs
+        mock_granola.get_transcript.return_value = []
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send(payload):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(status_code=200)
+
+        mock_webhook.send.side_effect = send
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        service.config = Config(
+            webhook=config.webhook,
+            granola=GranolaConfig(folders=["SQP"], folder_ids={"SQP": "sqp-folder-id"}),
+            sync=SyncConfig(interval=60, batch_size=10, concurrency=2),
+            state=config.state,
+        )
+        summary = await service.sync_once()
+
+        assert max_in_flight == 2
+        assert summary["documents_synced"] == 5
+        assert summary["documents_pending"] == 1
+        assert [d["id"] for d in summary["by_folder"]["SQP"]["documents"]] == [
+            d["id"] for d in docs
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_once_fetches_folders_concurrently(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test folders are fetched at the same time rather than one after another."""
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def get_documents_by_folder(folder_id):
+            started.append(folder_id)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return [_make_doc(f"{folder_id}-doc", "Meeting", "Notes")]
+
+        mock_granola.get_documents_by_folder.side_effect = get_documents_by_folder
+        mock_granola.get_transcript.return_value = []
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        summary = await service.sync_once()
+
+        assert summary["documents_synced"] == 2
+        assert list(summary["by_folder"]) == ["SQP", "CLIENT-A"]
+
+    @pytest.mark.asyncio
+    async def test_sync_once_document_in_two_folders_sent_once(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test a document listed in two folders is synced once, under the first folder."""
+        mock_granola.get_documents_by_folder.return_value = [_make_doc("shared")]
+        mock_granola.get_transcript.return_value = []
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        summary = await service.sync_once()
+
+        assert mock_webhook.send.call_count == 1
+        assert mock_webhook.send.call_args[0][0]["folder_name"] == "SQP"
+        assert summary["by_folder"]["SQP"]["synced"] == 1
+        assert summary["by_folder"]["CLIENT-A"]["new"] == 0
+
+    @pytest.mark.asyncio
+    async def test_dispatcher_sends_webhooks_in_background(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test documents are queued for background workers while run() is looping."""
+        release = asyncio.Event()
+
+        async def send(payload):
+            await release.wait()
+            return MagicMock(status_code=200)
+
+        mock_webhook.send.side_effect = send
+        mock_granola.get_documents_by_folder.return_value = [_make_doc("doc1")]
+        mock_granola.get_transcript.return_value = []
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        service._start_dispatcher()
+
+        first = await service.sync_once()
+        # Still being sent, so the next cycle must not queue it again
+        second = await service.sync_once()
+
+        assert first["documents_queued"] == 1
+        assert first["by_folder"]["SQP"]["documents"][0]["action"] == "queued"
+        assert second["documents_queued"] == 0
+        assert not state_manager.is_document_seen("doc1")
+
+        release.set()
+        await service._stop_dispatcher()
+
+        assert mock_webhook.send.call_count == 1
+        assert state_manager.is_document_seen("doc1")
+        assert StateManager(str(state_manager.state_file)).is_document_seen("doc1")
+
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_wait_between_cycles(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test stop() ends run() without waiting out the poll interval."""
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        cycle_done = asyncio.Event()
+        sync_once = service.sync_once
+
+        async def tracked_sync_once(**kwargs):
+            summary = await sync_once(**kwargs)
+            cycle_done.set()
+            return summary
+
+        service.sync_once = tracked_sync_once
+        task = asyncio.create_task(service.run())
+        await cycle_done.wait()
+
+        service.stop()
+        # The configured interval is 60s; run() must return well before that
+        await asyncio.wait_for(task, timeout=1)
+
+        mock_granola.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_run_does_not_wait_for_blocked_send(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test cancelling run() abandons queued documents and saves completed ones."""
+        blocked = asyncio.Event()
+
+        async def send(payload):
+            if payload["note_id"] == "doc1":
+                blocked.set()
+                await asyncio.Event().wait()  # Never answers
+            return MagicMock(status_code=200)
+
+        mock_webhook.send.side_effect = send
+        mock_granola.get_documents_by_folder.return_value = [_make_doc("doc1"), _make_doc("doc2")]
+        mock_granola.get_transcript.return_value = []
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        task = asyncio.create_task(service.run())
+        await blocked.wait()
+        while not state_manager.is_document_seen("doc2"):
+            await asyncio.sleep(0)
+
+        task.cancel()
+        # Guards against a hang; the cancelled run() returns without waiting on doc1
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=5)
+
+        assert service._dispatch_workers == []
+        assert not service._queued_doc_ids
+        mock_granola.close.assert_awaited_once()
+        reloaded = StateManager(str(state_manager.state_file))
+        assert reloaded.is_document_seen("doc2")
+        assert not reloaded.is_document_seen("doc1")
+
+    @pytest.mark.asyncio
+    async def test_run_skips_cycle_while_documents_queued(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test run() doesn't poll again until queued documents are processed."""
+        config.sync.interval = 0
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        service.sync_once = AsyncMock()
+        service._queued_doc_ids.add("doc1")
+
+        task = asyncio.create_task(service.run())
+        await asyncio.sleep(0.01)
+        service.sync_once.assert_not_called()
+
+        service._queued_doc_ids.clear()
+        await asyncio.sleep(0.01)
+        service.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        service.sync_once.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_once_batched_webhooks(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test documents are sent in webhook.batch_size batches when batching is enabled."""
+        docs = [_make_doc(f"doc{i}", f"Meeting {i}", f"Notes {i}") for i in range(5)]
+        mock_granola.get_documents_by_folder.return_value = docs
+        mock_granola.get_transcripts_bulk.side_effect = lambda doc_ids: {
+            doc_id: RuntimeError("boom") if doc_id == "doc0" else [{"text": doc_id}]
+            for doc_id in doc_ids
+        }
+        mock_webhook.send_batch.side_effect = [
+            MagicMock(status_code=200),
+            httpx.HTTPStatusError("Server error", request=MagicMock(), response=MagicMock()),
+            MagicMock(status_code=200),
+        ]
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        service.config = Config(
+            webhook=WebhookConfig(
+                url="https://example.com/webhook", secret="s", batch=True, batch_size=2
+            ),
+            granola=GranolaConfig(
+                folders=["SQP"], folder_ids={"SQP": "sqp-folder-id"}, include_transcript=True
+            ),
+            sync=SyncConfig(interval=60, batch_size=10, concurrency=1),
+            state=config.state,
+        )
+        summary = await service.sync_once()
+
+        mock_webhook.send.assert_not_called()
+        batches = [c.args[0] for c in mock_webhook.send_batch.call_args_list]
+        assert [[p["note_id"] for p in batch] for batch in batches] == [
+            ["doc0", "doc1"],
+            ["doc2", "doc3"],
+            ["doc4"],
+        ]
+        assert batches[0][0]["transcript"] == ""
+        assert "doc1" in batches[0][1]["transcript"]
+        assert summary["documents_synced"] == 3
+        assert summary["documents_failed"] == 2
+        assert set(state_manager.get_failed_documents()) == {"doc2", "doc3"}
+
     @pytest.mark.asyncio
     async def test_sync_once_pending_content(
         self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
@@ -336,6 +619,52 @@ class TestSyncService:
         assert summary["documents_synced"] == 1
         assert not state_manager.is_document_pending("doc1")
 
+    @pytest.mark.asyncio
+    async def test_state_saved_when_cycle_fails(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test that documents delivered before a failure are persisted."""
+        mock_granola.get_documents_by_folder.return_value = [_make_doc("doc1")]
+        mock_granola.get_transcript.return_value = []
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        with (
+            patch.object(
+                service, "_recheck_pending_documents", AsyncMock(side_effect=RuntimeError("boom"))
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await service.sync_once()
+
+        reloaded = StateManager(config.state.file)
+        assert reloaded.is_document_seen("doc1")
+
+    @pytest.mark.asyncio
+    async def test_recheck_pending_fetches_documents_once(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test that re-checking several pending documents makes a single API call."""
+        state_manager.mark_pending("doc1", {"title": "Meeting 1"}, "SQP")
+        state_manager.mark_pending("doc2", {"title": "Meeting 2"}, "SQP")
+
+        mock_granola.get_documents.return_value = [
+            _make_doc("doc1", "Meeting 1", "Now has notes!"),
+            _make_doc("doc2", "Meeting 2", ""),
+        ]
+        mock_granola.get_documents_by_folder.return_value = []
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        summary = await service.sync_once()
+
+        mock_granola.get_documents.assert_awaited_once()
+        assert summary["documents_synced"] == 1
+        assert not state_manager.is_document_pending("doc1")
+        assert state_manager.is_document_pending("doc2")
+
     @pytest.mark.asyncio
     async def test_api_fallback_to_cache(
         self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
@@ -365,6 +694,57 @@ class TestSyncService:
         assert summary["documents_found"] == 1
         assert summary["documents_synced"] == 1
 
+    @pytest.mark.asyncio
+    async def test_cache_read_once_per_cycle(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test folder resolution and the fallback for every folder share one cache reader."""
+        mock_granola.get_documents_by_folder.side_effect = httpx.HTTPStatusError(
+            "Server error", request=MagicMock(), response=MagicMock(status_code=500)
+        )
+
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        with patch("granola_sync.sync.GranolaCacheReader") as mock_cache_cls:
+            mock_cache_cls.return_value.get_folder_map.return_value = {}
+            mock_cache_cls.return_value.get_documents_for_folder.return_value = []
+            await service.sync_once()
+
+        assert mock_cache_cls.call_count == 1
+        assert mock_cache_cls.return_value.get_documents_for_folder.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_connection_pool(self, config: Config):
+        """Test the Granola client and webhook sender use the service's HTTP client."""
+        service = SyncService(config)
+
+        http_client = service._http
+        assert await service.granola._get_client() is http_client
+        assert await service.webhook._get_client() is http_client
+
+        await service.granola.close()
+        await service.webhook.close()
+        assert not http_client.is_closed
+
+        await service.close()
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_no_connection_pool_when_clients_injected(
+        self, config: Config, mock_granola, mock_webhook, state_manager
+    ):
+        """Test no HTTP client is created when neither client needs one."""
+        with patch("granola_sync.sync.create_http_client") as create_client:
+            service = SyncService(
+                config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+            )
+            await service.close()
+
+        create_client.assert_not_called()
+        mock_granola.close.assert_awaited_once()
+        mock_webhook.close.assert_awaited_once()
+
 
 class TestFolderMapResolution:
     """Tests for folder name → ID resolution."""
@@ -514,6 +894,51 @@ class TestBuildPayload:
         assert payload["participants"] == ["John Doe", "Jane Smith"]
         assert payload["url"] == "https://notes.granola.ai/d/doc123"
 
+    @pytest.mark.asyncio
+    async def test_build_payload_reused_for_same_version(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test the rendered notes are reused until the document's updated_at changes."""
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        doc = _make_doc("doc1", notes_markdown="", last_viewed_panel={"content": {
+            "type": "doc",
+            "content": [{"type": "paragraph", "content": [{"type": "text", "text": "v1"}]}],
+        }})
+
+        with patch.object(
+            service, "_prosemirror_to_text", wraps=service._prosemirror_to_text
+        ) as render:
+            first = service._build_payload(doc, "SQP", None)
+            second = service._build_payload(
+                doc, "SQP", [{"source": "microphone", "text": "Hi"}]
+            )
+            assert render.call_count == 1
+
+            service._build_payload({**doc, "updated_at": "2026-01-18T10:00:00Z"}, "SQP", None)
+            assert render.call_count == 2
+
+        assert first["note_text"] == second["note_text"] == "v1"
+        assert first["transcript"] == ""
+        assert second["transcript"] == "Me: Hi"
+
+    @pytest.mark.asyncio
+    async def test_build_payload_does_not_share_cached_participants(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test mutating a returned payload doesn't change later payloads for the document."""
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+        doc = _make_doc("doc1", people=[{"name": "Jane Smith"}])
+
+        first = service._build_payload(doc, "SQP", None)
+        first["participants"].append("Mallory")
+        second = service._build_payload(doc, "SQP", None)
+
+        assert second["participants"] == ["Jane Smith"]
+
     @pytest.mark.asyncio
     async def test_build_payload_with_transcript(
         self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
@@ -568,6 +993,25 @@ class TestBuildPayload:
         assert "Alice" in payload["participants"]
         assert "bob@example.com" in payload["participants"]
 
+    @pytest.mark.asyncio
+    async def test_build_payload_merges_top_level_attendees(
+        self, config: Config, mock_granola: MagicMock, mock_webhook: MagicMock, state_manager: StateManager
+    ):
+        """Test top-level attendee names are appended once, after people."""
+        service = SyncService(
+            config, granola=mock_granola, webhook=mock_webhook, state=state_manager
+        )
+
+        doc = {
+            "id": "doc123",
+            "title": "Meeting",
+            "people": [{"display_name": "Alice"}, {"name": "Bob"}],
+            "attendees": ["Bob", "Carol", {"name": "ignored"}, "Carol"],
+        }
+
+        payload = service._build_payload(doc, "SQP", None)
+        assert payload["participants"] == ["Alice", "Bob", "Carol"]
+
 
 class TestProseMirrorToText:
     """Tests for ProseMirror content conversion."""
@@ -650,3 +1094,11 @@ class TestProseMirrorToText:
 
         text = service._prosemirror_to_text(content)
         assert "- " in text or "Item 1" in text
+
+    def test_deeply_nested_content(self, service: SyncService):
+        """Test nesting deeper than the recursion limit is converted."""
+        node = {"type": "paragraph", "content": [{"type": "text", "text": "Deep"}]}
+        for _ in range(5000):
+            node = {"type": "blockquote", "content": [node]}
+
+        assert service._prosemirror_to_text({"type": "doc", "content": [node]}) == "Deep"
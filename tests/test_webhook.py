@@ -1,8 +1,10 @@
 """Tests for webhook sender."""
 
+import asyncio
 import hashlib
 import hmac
 import json
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
@@ -89,6 +91,19 @@ class TestVerifySignature:
 
         assert verify_signature(payload, "secret2", signature) is False
 
+    def test_verify_malformed_signature(self):
+        """Test signatures with the wrong scheme or bad hex are rejected."""
+        payload = {"test": "data"}
+        hex_digest = sign_payload(payload, "test-secret").removeprefix("sha256=")
+
+        assert verify_signature(payload, "test-secret", f"sha1={hex_digest}") is False
+        assert verify_signature(payload, "test-secret", hex_digest) is False
+        assert verify_signature(payload, "test-secret", f"sha256={hex_digest[:-2]}") is False
+        assert verify_signature(payload, "test-secret", f"sha256={hex_digest.upper()}") is False
+        assert verify_signature(payload, "test-secret", f"sha256= {hex_digest}") is False
+        assert verify_signature(payload, "test-secret", f"sha256={hex_digest}\n") is False
+        assert verify_signature(payload, "test-secret", "sha256=\udc80") is False
+
 
 class TestWebhookSender:
     """Tests for WebhookSender class."""
@@ -117,6 +132,29 @@ class TestWebhookSender:
         assert response.status_code == 200
         await sender.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_send_reuses_client(self, sender):
+        """Test repeated sends go through one pooled HTTP/2 client."""
+        route = respx.post("https://example.com/webhooks/granola/").mock(
+            return_value=httpx.Response(200)
+        )
+
+        with patch(
+            "granola_sync.granola_api.httpx.AsyncHTTPTransport",
+            wraps=httpx.AsyncHTTPTransport,
+        ) as transport:
+            await sender.send({"note_id": "doc0"})
+        client = sender._client
+        for i in range(1, 10):
+            await sender.send({"note_id": f"doc{i}"})
+
+        assert route.call_count == 10
+        assert sender._client is client
+        assert transport.call_args.kwargs["http2"] is True
+
+        await sender.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_send_includes_signature(self, sender):
@@ -138,6 +176,43 @@ class TestWebhookSender:
 
         await sender.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_send_batch(self, sender):
+        """Test that a batch is sent as one signed request with an events array."""
+        route = respx.post("https://example.com/webhooks/granola/").mock(
+            return_value=httpx.Response(200)
+        )
+
+        payloads = [{"note_id": "doc1"}, {"note_id": "doc2"}]
+        await sender.send_batch(payloads)
+
+        assert route.call_count == 1
+        request = route.calls[0].request
+        body = json.loads(request.content)
+        assert body == {"source": "Granola", "events": payloads}
+        assert verify_signature(body, "test-secret", request.headers["X-Granola-Signature"])
+
+        await sender.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_send_body_is_signed_bytes(self, sender):
+        """Test the request body is exactly the bytes that were signed."""
+        route = respx.post("https://example.com/webhooks/granola/").mock(
+            return_value=httpx.Response(200)
+        )
+
+        payload = {"note_id": "doc1", "title": "Réunion – café"}
+        await sender.send(payload)
+
+        request = route.calls[0].request
+        expected = hmac.new(b"test-secret", request.content, hashlib.sha256).hexdigest()
+        assert request.headers["X-Granola-Signature"] == f"sha256={expected}"
+        assert json.loads(request.content) == payload
+
+        await sender.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_send_includes_user_agent(self, sender):
@@ -174,6 +249,27 @@ class TestWebhookSender:
 
         await sender.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_send_retry_reuses_signed_body(self, sender):
+        """Test the payload is serialized and signed once across retries."""
+        route = respx.post("https://example.com/webhooks/granola/").mock(
+            side_effect=[
+                httpx.Response(500),
+                httpx.Response(200),
+            ]
+        )
+
+        with patch.object(sender, "_hmac", wraps=sender._hmac) as mac:
+            await sender.send({"note_id": "doc1"})
+
+        mac.copy.assert_called_once()
+        first, second = (call.request for call in route.calls)
+        assert first.content == second.content
+        assert first.headers["X-Granola-Signature"] == second.headers["X-Granola-Signature"]
+
+        await sender.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_send_no_retry_on_client_error(self, sender):
@@ -190,6 +286,70 @@ class TestWebhookSender:
 
         await sender.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_send_retry_backoff_is_exponential_and_capped(self):
+        """Test retry delays double per attempt, are capped and jittered."""
+        sender = WebhookSender(
+            url="https://example.com/webhooks/granola/",
+            secret="test-secret",
+            retry_attempts=4,
+            retry_delay=10,
+            max_retry_delay=25,
+        )
+        respx.post("https://example.com/webhooks/granola/").mock(
+            return_value=httpx.Response(503)
+        )
+
+        with (
+            patch("granola_sync.webhook.random.random", return_value=0.5),
+            patch("granola_sync.webhook.asyncio.sleep", new_callable=AsyncMock) as sleep,
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await sender.send({"test": "data"})
+
+        assert [call.args[0] for call in sleep.await_args_list] == [10, 20, 25]
+
+        await sender.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_send_retry_backoff_does_not_block_other_sends(self):
+        """Test a send backing off on 429 lets concurrent sends complete."""
+        sender = WebhookSender(
+            url="https://example.com/webhooks/granola/",
+            secret="test-secret",
+            retry_attempts=2,
+        )
+        rate_limited = iter([httpx.Response(429), httpx.Response(200)])
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if json.loads(request.content)["note_id"] == "slow":
+                return next(rate_limited)
+            return httpx.Response(200)
+
+        respx.post("https://example.com/webhooks/granola/").mock(side_effect=respond)
+
+        backing_off = asyncio.Event()
+        end_backoff = asyncio.Event()
+
+        async def backoff(delay: float) -> None:
+            backing_off.set()
+            await end_backoff.wait()
+
+        with patch("granola_sync.webhook.asyncio.sleep", side_effect=backoff):
+            slow = asyncio.create_task(sender.send({"note_id": "slow"}))
+            await backing_off.wait()
+
+            response = await sender.send({"note_id": "fast"})
+
+            assert response.status_code == 200
+            assert not slow.done()
+            end_backoff.set()
+            assert (await slow).status_code == 200
+
+        await sender.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_send_retry_on_rate_limit(self, sender):